@@ -12,8 +12,8 @@ from PyQt6.QtWidgets import QApplication
 from src.core.config_manager import ConfigManager
 from src.core.metrics_worker import MetricsWorker
 from src.ui.main_window import MainWindow
+from src.ui.metrics_formatter import MetricsFormatter
 from src.utils.console_handler import ConsoleHandler
-from monitor.utils.hardware_monitor import HardwareMonitor
 from settings_dialog import SettingsDialog
 
 
@@ -27,10 +27,14 @@ def main():
     if ConsoleHandler.is_windows():
         ConsoleHandler.hide_console()
     
+    # Imported here rather than at the top: it pulls in psutil/wmi and runs NVML init,
+    # which would otherwise delay the QApplication and keep the console visible meanwhile
+    from monitor.utils.hardware_monitor import HardwareMonitor
+    
     # Initialize components
     config_manager = ConfigManager()
     hardware_monitor = HardwareMonitor()
-    metrics_worker = MetricsWorker(hardware_monitor)
+    metrics_worker = MetricsWorker(hardware_monitor, formatters=MetricsFormatter().category_formatters())
     
     # Create main window
     window = MainWindow(
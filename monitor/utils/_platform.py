@@ -0,0 +1,9 @@
+import platform
+
+# The OS never changes while we run, so resolve it once at import and let the
+# collectors test plain booleans instead of comparing platform.system() strings
+_SYSTEM = platform.system()
+
+IS_WINDOWS = _SYSTEM == "Windows"
+IS_LINUX = _SYSTEM == "Linux"
+IS_DARWIN = _SYSTEM == "Darwin"
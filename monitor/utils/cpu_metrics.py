@@ -1,10 +1,10 @@
 import psutil
-import platform
 import wmi
 from typing import Dict, Optional, Union
 import os
 import ctypes
 from ctypes import byref, c_ulonglong
+from ._platform import IS_WINDOWS
 from .logging_utils import get_logger
 
 # Initialize logger
@@ -16,12 +16,11 @@ class CPUMetricsCollector:
 
     def __init__(self):
         """Initialize the metrics collector based on the platform"""
-        self.platform = platform.system()
         # self.wmi_connection for LHM is removed, will be created on-demand
         self.base_frequency = self._get_base_frequency()
         # self.lhm_available is removed, success will be determined on-demand
 
-        if self.platform == "Windows":
+        if IS_WINDOWS:
             # Initialize WMI connection for basic Windows metrics (non-LHM)
             try:
                 self.basic_wmi = wmi.WMI() # For MSAcpi_ThermalZoneTemperature
@@ -32,7 +31,7 @@ class CPUMetricsCollector:
     def _get_base_frequency(self) -> float:
         """Get CPU base frequency in MHz"""
         try:
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 # Try getting from WMI first
                 w = wmi.WMI()
                 cpu_info = w.Win32_Processor()[0]
@@ -150,7 +149,7 @@ class CPUMetricsCollector:
             "voltage": None,
         }
 
-        if self.platform == "Windows":
+        if IS_WINDOWS:
             # Try LibreHardwareMonitor first
             lhm_metrics = self._get_libre_hardware_metrics()
             # Update metrics, LHM values take precedence if not None
@@ -1,5 +1,6 @@
-import platform
+import threading
 from typing import Dict, Optional
+from ._platform import IS_WINDOWS
 from .logging_utils import get_logger
 
 # Initialize logger
@@ -31,15 +32,56 @@ except ImportError:
 except Exception as e:
     logger.error(f"Error initializing WMI for LHM: {e}")
 
+# Direct SWbem access to LibreHardwareMonitor through pywin32, skipping wmi.py's
+# per-object wrapping and property introspection. wmi.py is kept as a fallback.
+LHM_SWBEM_MONIKER = r"winmgmts:\\.\root\LibreHardwareMonitor"
+WBEM_FLAG_FAST_FORWARD = 0x30 # wbemFlagReturnImmediately | wbemFlagForwardOnly
+win32com_client = None
+if IS_WINDOWS:
+    try:
+        import win32com.client as win32com_client
+        LHM_WMI_AVAILABLE = True
+    except ImportError:
+        pass
+
+# Every GPU metric key, in display order; each source starts from dict.fromkeys() of this.
+# vram_used_gb / vram_total_gb are calculated from NVML, LHM only gives a percentage.
+_GPU_METRIC_KEYS = (
+    "core_frequency",
+    "core_usage",
+    "core_temperature",
+    "memory_frequency",
+    "vram_usage_percent",
+    "memory_temperature",
+    "hotspot_temperature",
+    "fan_speed",
+    "vram_used_gb",
+    "vram_total_gb",
+)
+
+# LHM sensor identifiers look like /nvidiagpu/0/..., /amdgpu/0/... or /intelgpu/0/...
+LHM_GPU_SENSOR_WQL = (
+    "SELECT Name, Identifier, SensorType, Value FROM Sensor "
+    "WHERE (SensorType='Temperature' OR SensorType='Load' "
+    "OR SensorType='Clock' OR SensorType='Fan') "
+    "AND Identifier LIKE '%gpu%'"
+)
+
+# When NVML reports all of these, LHM has nothing essential to add
+NVIDIA_CORE_METRICS = ("core_temperature", "core_usage", "core_frequency", "vram_usage_percent")
+
 class GPUMetricsCollector:
     """A class to handle GPU metrics collection"""
 
     def __init__(self):
         """Initialize the GPU metrics collector"""
         global NVIDIA_AVAILABLE # Declare global at the beginning of the scope where it might be modified
-        self.platform = platform.system()
         # self.wmi_connection for LHM is removed, will be created on-demand
         self.handle = None # For NVIDIA
+        self._nvml_unsupported = set() # Optional NVML metrics this GPU/driver can't report
+        self._lhm_id_to_slot: Dict[str, str] = {} # LHM sensor Identifier -> metric key
+        self._lhm_cached_wql = None
+        self._lhm_local = threading.local() # Per-thread LHM connection (COM objects are apartment bound)
 
         if NVIDIA_AVAILABLE: # Check the global status first
             try:
@@ -58,18 +100,7 @@ class GPUMetricsCollector:
 
     def _get_nvidia_metrics(self) -> Dict[str, Optional[float]]:
         """Get metrics from NVIDIA GPU"""
-        metrics = {
-            "core_frequency": None,
-            "core_usage": None,
-            "core_temperature": None,
-            "memory_frequency": None,
-            "vram_usage_percent": None, # Standardized key
-            "memory_temperature": None,
-            "hotspot_temperature": None,
-            "fan_speed": None,
-            "vram_used_gb": None, # For NVIDIA, calculated
-            "vram_total_gb": None # For NVIDIA, calculated
-        }
+        metrics = dict.fromkeys(_GPU_METRIC_KEYS)
 
         if not self.handle:
             return metrics
@@ -100,149 +131,152 @@ class GPUMetricsCollector:
             )
             metrics["memory_frequency"] = float(mem_clock)
 
-            # Try to get memory temperature and hotspot (not all GPUs support this)
-            try:
-                mem_temp = pynvml.nvmlDeviceGetTemperature(
-                    self.handle, pynvml.NVML_TEMPERATURE_MEMORY
-                )
-                metrics["memory_temperature"] = float(mem_temp)
-            except:
-                pass
-
-            try:
-                hotspot = pynvml.nvmlDeviceGetTemperature(
-                    self.handle, pynvml.NVML_TEMPERATURE_HOTSPOT
-                )
-                metrics["hotspot_temperature"] = float(hotspot)
-            except:
-                pass
-
-            try:
-                fan_speed_val = pynvml.nvmlDeviceGetFanSpeed(self.handle) # Default is first fan
-                metrics["fan_speed"] = float(fan_speed_val)
-            except pynvml.NVMLError_NotSupported:
-                metrics["fan_speed"] = None # Not supported on this GPU
-            except Exception:
-                metrics["fan_speed"] = None # Other error
+            # Try to get memory temperature and hotspot (not all GPUs support this).
+            # Once a query reports NotSupported (or pynvml lacks the sensor constant)
+            # it is remembered and never retried.
+            unsupported = self._nvml_unsupported
+            if "memory_temperature" not in unsupported:
+                try:
+                    mem_temp = pynvml.nvmlDeviceGetTemperature(
+                        self.handle, pynvml.NVML_TEMPERATURE_MEMORY
+                    )
+                    metrics["memory_temperature"] = float(mem_temp)
+                except (pynvml.NVMLError_NotSupported, AttributeError):
+                    unsupported.add("memory_temperature")
+                except pynvml.NVMLError:
+                    pass
+
+            if "hotspot_temperature" not in unsupported:
+                try:
+                    hotspot = pynvml.nvmlDeviceGetTemperature(
+                        self.handle, pynvml.NVML_TEMPERATURE_HOTSPOT
+                    )
+                    metrics["hotspot_temperature"] = float(hotspot)
+                except (pynvml.NVMLError_NotSupported, AttributeError):
+                    unsupported.add("hotspot_temperature")
+                except pynvml.NVMLError:
+                    pass
+
+            if "fan_speed" not in unsupported:
+                try:
+                    fan_speed_val = pynvml.nvmlDeviceGetFanSpeed(self.handle) # Default is first fan
+                    metrics["fan_speed"] = float(fan_speed_val)
+                except pynvml.NVMLError_NotSupported:
+                    unsupported.add("fan_speed") # Passively cooled / no fan control on this GPU
+                except pynvml.NVMLError:
+                    pass # Transient error, metrics["fan_speed"] stays None
 
         except Exception as e:
             logger.error(f"Error getting NVIDIA metrics: {e}")
 
         return metrics
 
+    @staticmethod
+    def _classify_lhm_gpu_sensor(s_type: str, sensor_name_upper: str) -> Optional[str]:
+        """Map an LHM GPU sensor to the metric key it provides, if any"""
+        if s_type == "Temperature":
+            if "GPU CORE" in sensor_name_upper:
+                return "core_temperature"
+            elif "GPU MEMORY" in sensor_name_upper:
+                return "memory_temperature"
+            elif "GPU HOT SPOT" in sensor_name_upper:
+                return "hotspot_temperature"
+        elif s_type == "Load":
+            if "GPU CORE" in sensor_name_upper:
+                return "core_usage"
+            elif "GPU MEMORY CONTROLLER" in sensor_name_upper: # LHM often reports this for VRAM usage
+                return "vram_usage_percent"
+            elif "GPU D3D 3D" in sensor_name_upper: # Alternative for core usage
+                return "core_usage"
+        elif s_type == "Clock":
+            if "GPU CORE" in sensor_name_upper:
+                return "core_frequency"
+            elif "GPU MEMORY" in sensor_name_upper:
+                return "memory_frequency"
+        elif s_type == "Fan":
+            if "GPU" in sensor_name_upper or "FAN" in sensor_name_upper:
+                return "fan_speed"
+        return None
+
+    def _get_lhm_connection(self):
+        """Return this thread's LHM namespace connection, connecting on first use"""
+        connection = getattr(self._lhm_local, "connection", None)
+        if connection is None:
+            if win32com_client is not None:
+                connection = win32com_client.GetObject(LHM_SWBEM_MONIKER)
+            else:
+                connection = WMIService.WMI(namespace=r"root\LibreHardwareMonitor")
+            self._lhm_local.connection = connection
+        return connection
+
+    @staticmethod
+    def _lhm_query(connection, wql: str):
+        """Run a WQL query on an LHM connection from _get_lhm_connection"""
+        if win32com_client is not None:
+            # Forward-only, semi-synchronous: rows stream back without a cached result set
+            return connection.ExecQuery(wql, "WQL", WBEM_FLAG_FAST_FORWARD)
+        return connection.query(wql)
+
     def _get_lhm_metrics(self) -> Dict[str, Optional[float]]:
         """Get metrics using LibreHardwareMonitor on Windows"""
-        if not LHM_WMI_AVAILABLE or WMIService is None:
+        if not LHM_WMI_AVAILABLE:
             logger.debug("LHM WMI not available for GPU metrics.")
-            return {
-                "core_frequency": None,
-                "core_usage": None,
-                "core_temperature": None,
-                "memory_frequency": None,
-                "vram_usage_percent": None, 
-                "memory_temperature": None,
-                "hotspot_temperature": None,
-                "fan_speed": None
-            }
-        metrics = {
-            "core_frequency": None,
-            "core_usage": None,
-            "core_temperature": None,
-            "memory_frequency": None,
-            "vram_usage_percent": None, # Standardized key
-            "memory_temperature": None,
-            "hotspot_temperature": None,
-            "fan_speed": None
-            # LHM does not typically provide VRAM total/used in GB directly, relies on percentage.
-        }
-
-        lhm_wmi_connection = None
+            return dict.fromkeys(_GPU_METRIC_KEYS)
+        metrics = dict.fromkeys(_GPU_METRIC_KEYS)
+
         try:
-            lhm_wmi_connection = WMIService.WMI(namespace=r"root\LibreHardwareMonitor") # Use the imported WMIService
+            lhm_wmi_connection = self._get_lhm_connection()
         except Exception as e:
             logger.debug(f"Failed to connect to LHM WMI for GPU metrics: {e}")
             return metrics # Return initialized metrics dict (all None)
 
         try:
-            sensors = lhm_wmi_connection.Sensor()
-            if not sensors:
-                logger.debug("LHM WMI connected for GPU but no sensors found.")
+            if self._lhm_id_to_slot:
+                # Warm path: fetch only the sensors classified on an earlier poll
+                for sensor in self._lhm_query(lhm_wmi_connection, self._lhm_cached_wql):
+                    slot = self._lhm_id_to_slot.get(sensor.Identifier)
+                    if slot is not None and sensor.Value is not None:
+                        metrics[slot] = sensor.Value
                 return metrics
 
-            # Identify the correct GPU if multiple are present (e.g. by checking name against NVIDIA if possible)
-            # For simplicity now, we assume LHM sensors for 'GPU' are for the primary one.
-            # More robust would be to match sensor.Identifier with a known GPU path if LHM provides it.
-
-            gpu_sensor_keywords = ["GPU", "NVIDIA", "AMD", "RADEON", "INTEL GRAPHICS"]
-            gpu_instance_id_paths = ["/nvidiagpu/", "/amdgpu/", "/intelgpu/"]
+            # Let the WMI provider do the filtering so only GPU rows (and only the
+            # columns we read) are marshalled across the COM boundary.
+            id_to_slot = {}
+            found = False
+            for sensor in self._lhm_query(lhm_wmi_connection, LHM_GPU_SENSOR_WQL):
+                found = True
+                if sensor.Value is None: # Skip sensors without a value
+                    continue
 
-            for sensor in sensors:
-                sensor_name_upper = "" # Initialize here
-                sensor_identifier_lower = "" # Initialize here
-                s_type = "" # Initialize here
+                sensor_name_upper = sensor.Name.upper() if sensor.Name else ""
+                slot = self._classify_lhm_gpu_sensor(sensor.SensorType, sensor_name_upper)
+                if slot is not None and metrics[slot] is None:
+                    metrics[slot] = sensor.Value
+                    id_to_slot[sensor.Identifier] = slot
 
-                if not hasattr(sensor, 'Value') or sensor.Value is None: # Skip sensors without a value
-                    continue
-                
-                if hasattr(sensor, 'SensorType') and sensor.SensorType:
-                    s_type = sensor.SensorType
-                else:
-                    continue # Skip if no SensorType
-
-                is_relevant_gpu_sensor = False
-                
-                if hasattr(sensor, 'Identifier') and sensor.Identifier:
-                    sensor_identifier_lower = sensor.Identifier.lower()
-                    for path_part in gpu_instance_id_paths:
-                        if path_part in sensor_identifier_lower:
-                            is_relevant_gpu_sensor = True
-                            break
-                
-                if hasattr(sensor, 'Name') and sensor.Name:
-                    sensor_name_upper = sensor.Name.upper()
-                    if not is_relevant_gpu_sensor: # Check name if identifier didn't match or wasn't present
-                        for keyword in gpu_sensor_keywords:
-                            if keyword in sensor_name_upper:
-                                is_relevant_gpu_sensor = True
-                                break
-                
-                if not is_relevant_gpu_sensor:
-                    continue
+            if not found:
+                logger.debug("LHM WMI connected for GPU but no sensors found.")
+                return metrics
 
-                # At this point, sensor is likely a GPU-related sensor
-                # Use sensor_name_upper which is already defined, and s_type
-                s_type = sensor.SensorType
-                # sensor_name_upper is already sensor.Name.upper() from above
-
-                # More specific matching for LHM GPU sensors
-                if s_type == "Temperature":
-                    if "GPU CORE" in sensor_name_upper and metrics["core_temperature"] is None:
-                        metrics["core_temperature"] = sensor.Value
-                    elif "GPU MEMORY" in sensor_name_upper and metrics["memory_temperature"] is None:
-                        metrics["memory_temperature"] = sensor.Value
-                    elif "GPU HOT SPOT" in sensor_name_upper and metrics["hotspot_temperature"] is None:
-                        metrics["hotspot_temperature"] = sensor.Value
-                elif s_type == "Load":
-                    if "GPU CORE" in sensor_name_upper and metrics["core_usage"] is None:
-                        metrics["core_usage"] = sensor.Value
-                    elif "GPU MEMORY CONTROLLER" in sensor_name_upper and metrics["vram_usage_percent"] is None: # LHM often reports this for VRAM usage usage
-                        metrics["vram_usage_percent"] = sensor.Value
-                    elif "GPU D3D 3D" in sensor_name_upper and metrics["core_usage"] is None: # Alternative for core usage
-                        metrics["core_usage"] = sensor.Value
-                elif s_type == "Clock":
-                    if "GPU CORE" in sensor_name_upper and metrics["core_frequency"] is None:
-                        metrics["core_frequency"] = sensor.Value
-                    elif "GPU MEMORY" in sensor_name_upper and metrics["memory_frequency"] is None:
-                        metrics["memory_frequency"] = sensor.Value
-                elif s_type == "Fan":
-                    if ("GPU" in sensor_name_upper or "FAN" in sensor_name_upper) and metrics["fan_speed"] is None:
-                        metrics["fan_speed"] = sensor.Value
+            # The Identifier -> metric mapping never changes, so remember it
+            if id_to_slot:
+                self._lhm_id_to_slot = id_to_slot
+                self._lhm_cached_wql = "SELECT Identifier, Value FROM Sensor WHERE " + " OR ".join(
+                    f"Identifier='{identifier}'" for identifier in id_to_slot
+                )
         
         except Exception as e:
             logger.error(f"Error querying LHM GPU sensors: {e}")
+            self._lhm_id_to_slot = {} # Re-classify on the next poll
+            self._lhm_local.connection = None # Reconnect too, LHM may have restarted
 
         return metrics
 
+    @staticmethod
+    def _merge(base: Dict[str, Optional[float]], extra: Dict[str, Optional[float]]) -> None:
+        """Fill missing or None entries of base with the non-None values from extra"""
+        base.update({k: v for k, v in extra.items() if v is not None and base.get(k) is None})
+
     def get_metrics(self) -> Dict[str, Optional[float]]:
         """Get GPU metrics from available sources
 
@@ -262,17 +296,13 @@ class GPUMetricsCollector:
         # Try NVIDIA metrics first
         metrics = self._get_nvidia_metrics()
 
+        # NVML already covered the core metrics, so skip the secondary sources entirely
+        if NVIDIA_AVAILABLE and all(metrics.get(k) is not None for k in NVIDIA_CORE_METRICS):
+            return metrics
+
         # If we're on Windows, try to augment with LibreHardwareMonitor data
         # This is useful if NVIDIA pynvml isn't available/working or for non-NVIDIA cards.
-        if self.platform == "Windows":
-            # If NVIDIA metrics are complete, we might not need LHM for GPU, 
-            # but LHM could provide data for AMD or Intel iGPUs.
-            # For now, always try LHM if on Windows and see if it fills any gaps or provides primary data.
-            lhm_gpu_metrics = self._get_lhm_metrics()
-            for key, value in lhm_gpu_metrics.items():
-                if metrics.get(key) is None and value is not None: # Fill gaps
-                    metrics[key] = value
-                elif key not in metrics and value is not None: # Add new metrics if LHM has them
-                     metrics[key] = value
-                     
+        if IS_WINDOWS:
+            self._merge(metrics, self._get_lhm_metrics())
+
         return metrics
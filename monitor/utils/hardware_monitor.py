@@ -1,14 +1,98 @@
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from .cpu_metrics import CPUMetricsCollector
 from .gpu_metrics import GPUMetricsCollector
 from .ram_metrics import RAMMetricsCollector
 from .network_metrics import NetworkMetricsCollector
+from ._platform import IS_WINDOWS
 from .logging_utils import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Value format for each metric key, resolved once instead of substring-scanning keys every frame
+DEFAULT_FMT = "{}"
+CPU_FMT = {
+    "frequency": "{:.2f} GHz",
+    "usage": "{:.2f}%",
+    "temperature": "{:.1f}°C",
+    "voltage": DEFAULT_FMT,
+}
+GPU_FMT = {
+    "core_frequency": DEFAULT_FMT,
+    "core_usage": "{:.2f}%",
+    "core_temperature": "{:.1f}°C",
+    "memory_frequency": DEFAULT_FMT,
+    "vram_usage_percent": "{:.2f}%",
+    "memory_temperature": "{:.1f}°C",
+    "hotspot_temperature": "{:.1f}°C",
+    "fan_speed": DEFAULT_FMT,
+    "vram_used_gb": DEFAULT_FMT,
+    "vram_total_gb": DEFAULT_FMT,
+}
+RAM_FMT = {
+    "total": "{:.2f} GB",
+    "used": "{:.2f} GB",
+    "available": "{:.2f} GB",
+    "percent": "{:.2f}%",
+    "ram_temperature": "{:.1f}°C",
+}
+NET_FMT = {
+    "upload_speed": "{:.2f} MB/s",
+    "download_speed": "{:.2f} MB/s",
+    "total_sent": "{:.2f} GB",
+    "total_received": "{:.2f} GB",
+}
+
+# (category, section title, formats, label used when the category is empty)
+METRIC_SECTIONS = (
+    ("cpu", "CPU", CPU_FMT, "CPU"),
+    ("gpu", "GPU", GPU_FMT, "GPU"),
+    ("ram", "RAM", RAM_FMT, "RAM"),
+    ("network", "NETWORK", NET_FMT, "Network"),
+)
+
+# Display names per metric key (unknown keys are added on first sight)
+PRETTY_NAMES = {
+    key: key.replace('_', ' ').title()
+    for formats in (CPU_FMT, GPU_FMT, RAM_FMT, NET_FMT)
+    for key in formats
+}
+
+# Idle backoff: after IDLE_SAMPLES quiet polls (GPU load under IDLE_USAGE_PERCENT and
+# core temperature moving less than IDLE_TEMP_DELTA) the poll period is doubled per
+# further quiet poll, up to IDLE_MAX_FACTOR times the requested interval.
+IDLE_USAGE_PERCENT = 5.0
+IDLE_TEMP_DELTA = 1.0
+IDLE_SAMPLES = 3
+IDLE_MAX_FACTOR = 5
+
+def _write_stdout(text: str) -> None:
+    """Write text to stdout as a single encoded write on the underlying byte buffer"""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (IDE console, StringIO capture): plain text write
+        stream.write(text)
+        stream.flush()
+        return
+    stream.flush() # Keep ordering with anything print() left in the text layer
+    buffer.write(text.encode(stream.encoding or "utf-8", errors="replace"))
+    buffer.flush()
+
+def _init_collector_thread() -> None:
+    """Initialize COM on collector pool threads so WMI queries work off the main thread"""
+    if not IS_WINDOWS:
+        return
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass # pywin32 not installed
+
+
 class HardwareMonitor:
     """A class to monitor all hardware metrics and display them in a user-friendly format."""
     
@@ -18,6 +102,15 @@ class HardwareMonitor:
         self.gpu_collector = GPUMetricsCollector()
         self.ram_collector = RAMMetricsCollector()
         self.network_collector = NetworkMetricsCollector()
+        # Collectors block on NVML/WMI/psutil calls, so run them concurrently:
+        # a poll then takes as long as the slowest collector rather than the sum.
+        self._pool = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="metrics-collector",
+            initializer=_init_collector_thread
+        )
+        self._idle_streak = 0
+        self._last_gpu_temp = None
         logger.info("HardwareMonitor initialized with all collectors")
         
     def get_all_metrics(self) -> Dict[str, Dict[str, Any]]:
@@ -28,19 +121,16 @@ class HardwareMonitor:
             Dict with categories as keys (cpu, gpu, ram, network) and their respective metrics as values
         """
         try:
-            cpu_metrics = self.cpu_collector.get_metrics()
-            gpu_metrics = self.gpu_collector.get_metrics()
-            ram_metrics = self.ram_collector.get_metrics()
-            network_metrics = self.network_collector.get_metrics()
-            
-            all_metrics = {
-                "cpu": cpu_metrics,
-                "gpu": gpu_metrics,
-                "ram": ram_metrics,
-                "network": network_metrics
+            futures = {
+                "cpu": self._pool.submit(self.cpu_collector.get_metrics),
+                "gpu": self._pool.submit(self.gpu_collector.get_metrics),
+                "ram": self._pool.submit(self.ram_collector.get_metrics),
+                "network": self._pool.submit(self.network_collector.get_metrics)
             }
             
-            logger.debug(f"Collected all hardware metrics successfully")
+            all_metrics = {category: future.result() for category, future in futures.items()}
+            
+            logger.debug("Collected all hardware metrics successfully")
             return all_metrics
             
         except Exception as e:
@@ -52,137 +142,134 @@ class HardwareMonitor:
                 "network": {}
             }
     
-    def display_metrics(self, metrics: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    def format_metrics(self, metrics: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
         """
-        Display all hardware metrics in a formatted manner.
+        Render all hardware metrics into a single formatted report string.
         
         Args:
             metrics: Optional pre-collected metrics. If None, will collect metrics on the spot.
+            
+        Returns:
+            The formatted report, newline-terminated
         """
         if metrics is None:
             metrics = self.get_all_metrics()
         
-        print("\n" + "="*60)
-        print(f"{' HARDWARE METRICS MONITOR ':=^60}")
-        print("="*60)
-        
-        # CPU Section
-        print("\n" + "-"*20 + " CPU METRICS " + "-"*20)
-        if metrics["cpu"]:
-            for key, value in metrics["cpu"].items():
-                if value is not None:
-                    # Format CPU usage and temperature values with specific precision
-                    if "usage" in key.lower() or "utilization" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f}%")
-                    elif "temp" in key.lower() or "temperature" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.1f}°C")
-                    elif "frequency" in key.lower() or "clock" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} GHz")
-                    else:
-                        print(f"  {key.replace('_', ' ').title()}: {value}")
-                else:
-                    print(f"  {key.replace('_', ' ').title()}: N/A")
-        else:
-            print("  No CPU metrics available")
-        
-        # GPU Section
-        print("\n" + "-"*20 + " GPU METRICS " + "-"*20)
-        if metrics["gpu"]:
-            for key, value in metrics["gpu"].items():
-                if value is not None:
-                    # Format GPU values with specific precision
-                    if "usage" in key.lower() or "utilization" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f}%")
-                    elif "temp" in key.lower() or "temperature" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.1f}°C")
-                    elif "memory" in key.lower() and "used" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} GB")
-                    elif "memory" in key.lower() and "total" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} GB")
-                    elif "clock" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value} MHz")
+        lines = ["", "="*60, f"{' HARDWARE METRICS MONITOR ':=^60}", "="*60]
+
+        for category, title, formats, label in METRIC_SECTIONS:
+            lines.append("")
+            lines.append("-"*20 + f" {title} METRICS " + "-"*20)
+            category_metrics = metrics[category]
+            if category_metrics:
+                for key, value in category_metrics.items():
+                    pretty = PRETTY_NAMES.get(key)
+                    if pretty is None:
+                        # Key outside the format tables: derive its name once and remember it
+                        pretty = PRETTY_NAMES[key] = key.replace('_', ' ').title()
+                    if value is not None:
+                        lines.append(f"  {pretty}: {formats.get(key, DEFAULT_FMT).format(value)}")
                     else:
-                        print(f"  {key.replace('_', ' ').title()}: {value}")
-                else:
-                    print(f"  {key.replace('_', ' ').title()}: N/A")
-        else:
-            print("  No GPU metrics available")
+                        lines.append(f"  {pretty}: N/A")
+            else:
+                lines.append(f"  No {label} metrics available")
+
+        lines += ["", "="*60, f"{' End of Hardware Metrics ':=^60}", "="*60 + "\n"]
+
+        return "\n".join(lines) + "\n"
+
+    def display_metrics(self, metrics: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Display all hardware metrics in a formatted manner.
         
-        # RAM Section
-        print("\n" + "-"*20 + " RAM METRICS " + "-"*20)
-        if metrics["ram"]:
-            for key, value in metrics["ram"].items():
-                if value is not None:
-                    # Format RAM values with specific precision
-                    if "percent" in key.lower() or "usage" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f}%")
-                    elif "gb" in key.lower() or "total" in key.lower() or "used" in key.lower() or "available" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} GB")
-                    elif "temp" in key.lower() or "temperature" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.1f}°C")
-                    else:
-                        print(f"  {key.replace('_', ' ').title()}: {value}")
-                else:
-                    print(f"  {key.replace('_', ' ').title()}: N/A")
-        else:
-            print("  No RAM metrics available")
+        Args:
+            metrics: Optional pre-collected metrics. If None, will collect metrics on the spot.
+        """
+        # Single write for the whole frame instead of one print() per line
+        _write_stdout(self.format_metrics(metrics))
+
+    def _idle_factor(self, gpu_metrics: Dict[str, Any]) -> int:
+        """
+        Update the GPU idle streak from the latest sample and return the interval multiplier.
         
-        # Network Section
-        print("\n" + "-"*20 + " NETWORK METRICS " + "-"*20)
-        if metrics["network"]:
-            for key, value in metrics["network"].items():
-                if value is not None:
-                    # Format network values with specific precision
-                    if "speed" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} MB/s")
-                    elif "total" in key.lower() or "sent" in key.lower() or "received" in key.lower():
-                        print(f"  {key.replace('_', ' ').title()}: {value:.2f} GB")
-                    else:
-                        print(f"  {key.replace('_', ' ').title()}: {value}")
-                else:
-                    print(f"  {key.replace('_', ' ').title()}: N/A")
-        else:
-            print("  No Network metrics available")
+        Args:
+            gpu_metrics: The GPU category of the latest metrics
             
-        print("\n" + "="*60)
-        print(f"{' End of Hardware Metrics ':=^60}")
-        print("="*60 + "\n")
+        Returns:
+            1 while the GPU is busy, growing up to IDLE_MAX_FACTOR while it stays idle
+        """
+        usage = gpu_metrics.get("core_usage")
+        temp = gpu_metrics.get("core_temperature")
+        last_temp = self._last_gpu_temp
+        self._last_gpu_temp = temp
+        
+        idle = (
+            usage is not None and usage < IDLE_USAGE_PERCENT
+            and (temp is None or last_temp is None or abs(temp - last_temp) < IDLE_TEMP_DELTA)
+        )
+        if not idle:
+            self._idle_streak = 0
+            return 1
+        
+        self._idle_streak += 1
+        if self._idle_streak < IDLE_SAMPLES:
+            return 1
+        return min(IDLE_MAX_FACTOR, 2 ** (self._idle_streak - IDLE_SAMPLES + 1))
 
-    def monitor_continuously(self, interval: float = 1.0, duration: Optional[float] = None) -> None:
+    def monitor_continuously(self, interval: float = 1.0, duration: Optional[float] = None,
+                             idle_backoff: bool = False) -> None:
         """
         Continuously monitor and display hardware metrics at specified intervals.
         
         Args:
             interval: Time in seconds between each metrics update (default: 1.0)
             duration: Optional total monitoring duration in seconds. If None, runs indefinitely.
+            idle_backoff: Stretch the interval (up to IDLE_MAX_FACTOR times) while the GPU is idle,
+                          returning to the requested rate on the first busy sample.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time
+        period = interval
         iterations = 0
+        self._idle_streak = 0
+        self._last_gpu_temp = None
         
         try:
+            # Clear once up front; later frames overwrite in place to avoid flicker
+            _write_stdout("\x1b[2J")
+            
             while True:
-                # Clear screen (for Windows)
-                print("\033c", end="")  # ANSI escape sequence to clear screen
-                
-                # Get and display metrics
+                # Get metrics and build the whole frame before touching the terminal
                 metrics = self.get_all_metrics()
-                self.display_metrics(metrics)
+                frame = self.format_metrics(metrics)
                 
                 # Show monitoring information
                 iterations += 1
-                elapsed_time = time.time() - start_time
-                print(f"Monitoring: Iteration #{iterations} | Running for: {elapsed_time:.1f}s | Refresh: {interval}s")
+                elapsed_time = time.monotonic() - start_time
+                frame += f"Monitoring: Iteration #{iterations} | Running for: {elapsed_time:.1f}s | Refresh: {period}s\n"
+                
+                # Cursor home, erase the tail of each rewritten line, clear anything below the frame
+                _write_stdout("\x1b[H" + frame.replace("\n", "\x1b[K\n") + "\x1b[J")
                 
                 # Check if we've reached the duration limit
                 if duration and elapsed_time >= duration:
                     print(f"\nMonitoring completed after {duration:.1f} seconds ({iterations} iterations)")
                     break
                     
-                # Wait for the next interval
-                time.sleep(interval)
+                # Schedule on a fixed grid so collection time doesn't stretch the period
+                if idle_backoff:
+                    period = interval * self._idle_factor(metrics.get("gpu", {}))
+                deadline += period
+                
+                # Wait for the next tick; if we overran it, resync instead of bursting to catch up
+                now = time.monotonic()
+                if deadline > now:
+                    time.sleep(deadline - now)
+                else:
+                    deadline = now
                 
         except KeyboardInterrupt:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             print(f"\nMonitoring stopped after {elapsed_time:.1f} seconds ({iterations} iterations)")
         except Exception as e:
             logger.error(f"Error in continuous monitoring: {e}")
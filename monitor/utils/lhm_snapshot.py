@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from .logging_utils import get_logger
+
+# Try to import wmi for Windows-specific LHM access
+try:
+    import wmi
+except ImportError:
+    wmi = None # WMI not available on non-Windows or if not installed
+
+# Configure logger
+logger = get_logger(__name__)
+
+LHM_NAMESPACE = r"root\LibreHardwareMonitor"
+LHM_ALL_SENSORS_WQL = "SELECT Name, Identifier, SensorType, Value FROM Sensor"
+
+
+class LHMSnapshot:
+    """
+    A process-wide snapshot of every LibreHardwareMonitor sensor.
+
+    One background thread runs a single WQL query per refresh and publishes the
+    result; collectors read it with plain dict lookups instead of each opening
+    their own WMI connection and querying on the polling path.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, ttl: float = 2.0) -> Optional["LHMSnapshot"]:
+        """Return the shared snapshot, starting its refresh thread on first use
+
+        Returns:
+            The snapshot, or None if the wmi module is unavailable
+        """
+        if wmi is None:
+            return None
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(ttl)
+        return cls._instance
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # SensorType -> {Identifier: (Name, Value)}. Replaced wholesale on every
+        # refresh, so readers can use the reference they got without locking.
+        self._sensors: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        self._thread = threading.Thread(target=self._refresh_loop, name="lhm-snapshot", daemon=True)
+        self._thread.start()
+
+    def _refresh_loop(self) -> None:
+        """Background loop re-reading all LHM sensors every ttl seconds"""
+        try:
+            import pythoncom
+            pythoncom.CoInitialize() # WMI needs COM initialized on this thread
+        except ImportError:
+            pass
+
+        conn = None
+        while True:
+            try:
+                if conn is None:
+                    conn = wmi.WMI(namespace=LHM_NAMESPACE)
+                sensors = {}
+                for sensor in conn.query(LHM_ALL_SENSORS_WQL):
+                    # Each property read on a WMI object is a COM call, so fetch each one once
+                    try:
+                        value = sensor.Value
+                        identifier = sensor.Identifier
+                        sensor_type = sensor.SensorType
+                        name = sensor.Name
+                    except AttributeError:
+                        continue
+                    if value is None or not identifier:
+                        continue
+                    sensors.setdefault(sensor_type, {})[identifier] = (name or "", float(value))
+            except Exception as e:
+                logger.debug(f"LHM snapshot refresh failed: {e}")
+                conn = None # Reconnect next time, LHM may have restarted
+                sensors = {} # Don't keep serving readings from a dead LHM
+
+            self._sensors = sensors
+            time.sleep(self.ttl)
+
+    def sensors(self, sensor_type: str) -> Dict[str, Tuple[str, float]]:
+        """Get the latest readings of one sensor type
+
+        Returns:
+            Dict mapping sensor Identifier to (Name, Value); empty until the first refresh
+        """
+        return self._sensors.get(sensor_type, {})
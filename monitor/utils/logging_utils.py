@@ -1,35 +1,121 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
+
+# Loggers only enqueue records; a single background QueueListener thread does the
+# formatting and the console/file writes, so the metric collectors never block on I/O.
+_log_queue = queue.Queue(-1)
+_listener = None
+_CONFIGURED = {} # (name, level, log_to_file, log_file_path) -> configured logger
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handlers = {} # log file path -> BufferedFileHandler shared by every logger writing there
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that batches writes through a large buffer, flushing every
+    flush_records records or flush_interval seconds instead of once per record.
+    """
+
+    def __init__(self, filename: str, flush_records: int = 50, flush_interval: float = 2.0,
+                 buffer_size: int = 65536):
+        super().__init__(open(filename, 'a', buffering=buffer_size))
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._pending += 1
+        if self._pending >= self.flush_records or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            try:
+                self.flush()
+                self.stream.close()
+            finally:
+                super().close()
+        finally:
+            self.release()
+
+def _stop_listener() -> None:
+    """Drain the log queue, then push out whatever the file buffers still hold"""
+    _listener.stop()
+    for fh in _file_handlers.values():
+        fh.flush()
+
+def _get_listener() -> logging.handlers.QueueListener:
+    """Start the shared queue listener (with its console handler) on first use"""
+    global _listener
+    if _listener is None:
+        ch = logging.StreamHandler()
+        ch.setFormatter(_FORMATTER)
+        _listener = logging.handlers.QueueListener(_log_queue, ch, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener) # Drain the queue before the interpreter exits
+    return _listener
+
+def _add_file_handler(listener: logging.handlers.QueueListener, logger_name: str, log_file_path: str) -> None:
+    """Route a logger's records to a log file through the shared listener"""
+    fh = _file_handlers.get(log_file_path)
+    if fh is None:
+        # Ensure the log directory exists if a specific path is given
+        if os.path.dirname(log_file_path):
+            os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+
+        fh = BufferedFileHandler(log_file_path)
+        fh.setFormatter(_FORMATTER)
+        fh.logger_names = set()
+        # The listener feeds every record to every handler, so only keep the
+        # records of loggers that asked for this file
+        fh.addFilter(lambda record, names=fh.logger_names: record.name in names)
+        _file_handlers[log_file_path] = fh
+        listener.handlers = listener.handlers + (fh,)
+    fh.logger_names.add(logger_name)
 
 def get_logger(name: str, level=logging.INFO, log_to_file=False, log_file_path='monitor.log'):
     """
     Configures and returns a logger instance.
     """
+    key = (name, level, log_to_file, log_file_path)
+    cached = _CONFIGURED.get(key)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(name)
-    
+
     # Prevent adding multiple handlers if logger already configured
     if not logger.handlers:
         logger.setLevel(level)
-        
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        
-        # Console Handler
-        ch = logging.StreamHandler()
-        ch.setLevel(level)
-        ch.setFormatter(formatter)
-        logger.addHandler(ch)
-        
+
+        listener = _get_listener()
+
+        # Queue Handler (console output happens on the listener thread)
+        qh = logging.handlers.QueueHandler(_log_queue)
+        qh.setLevel(level)
+        logger.addHandler(qh)
+
         # File Handler (optional)
         if log_to_file:
-            # Ensure the log directory exists if a specific path is given
-            if os.path.dirname(log_file_path):
-                os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-            
-            fh = logging.FileHandler(log_file_path)
-            fh.setLevel(level)
-            fh.setFormatter(formatter)
-            logger.addHandler(fh)
-            
+            _add_file_handler(listener, name, log_file_path)
+
+    _CONFIGURED[key] = logger
     return logger
 
 if __name__ == '__main__':
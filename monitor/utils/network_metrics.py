@@ -1,14 +1,19 @@
 import psutil
+import logging
 import time
-import platform
 from typing import Dict, Optional, Tuple
+from ._platform import IS_WINDOWS
+from .lhm_snapshot import LHMSnapshot
 from .logging_utils import get_logger
 
+# Configure logger (before the WMI import below, whose error handlers log)
+logger = get_logger(__name__)
+
 # WMI for LibreHardwareMonitor
 LHM_WMI_AVAILABLE = False
 WMIService = None
 try:
-    if platform.system() == "Windows": # Only attempt WMI import on Windows
+    if IS_WINDOWS: # Only attempt WMI import on Windows
         import wmi
         WMIService = wmi
         LHM_WMI_AVAILABLE = True
@@ -17,30 +22,86 @@ except ImportError:
 except Exception as e:
     logger.error(f"Error initializing WMI for LHM network metrics: {e}")
 
-# Configure logger
-logger = get_logger(__name__)
+# Bytes per MB / GB
+_MB = 1048576.0
+_GB = 1073741824.0
+
+# Shortest window (seconds) a speed is computed over; anything shorter is mostly timer noise
+MIN_SPEED_WINDOW = 0.2
+
+# Identifier prefix of LibreHardwareMonitor's network adapter sensors (/nic/{guid}/data/N)
+LHM_NIC_PREFIX = "/nic/"
+
+# Loopback adapters never carry real traffic and are skipped when picking the primary NIC
+def _is_loopback(nic_name: str) -> bool:
+    """Match loopback adapter names: lo (Linux), lo0 (macOS), Loopback Pseudo-Interface 1 (Windows)"""
+    return nic_name.startswith("Loopback") or (nic_name[:2] == "lo" and nic_name[2:].isdigit()) or nic_name == "lo"
 
 
 class NetworkMetricsCollector:
     """A class to handle network metrics collection across different platforms"""
 
-    def __init__(self):
-        """Initialize the network metrics collector"""
-        self.platform = platform.system()
+    def __init__(self, min_interval: float = 0.25):
+        """Initialize the network metrics collector
+
+        Args:
+            min_interval: Minimum seconds between psutil counter reads; polls
+                          arriving sooner get the previous sample back. Kept
+                          well under the fastest refresh rate (0.5 s), so timer
+                          jitter on that cadence never freezes the speeds for a tick.
+        """
+        self.min_interval = min_interval
+        # Reused across polls; callers get a copy
+        self._metrics = {
+            "upload_speed": None,
+            "download_speed": None,
+            "total_sent": None,
+            "total_received": None,
+        }
+        # The first poll only establishes a baseline: its window since __init__ is
+        # arbitrary (often tiny), so it reports no speeds instead of a bogus spike
+        self._has_sample = False
+        self._primary_nic = self._select_primary_nic()
         initial_counters = self._get_initial_psutil_counters()
         self.last_bytes_sent = initial_counters[0]
         self.last_bytes_recv = initial_counters[1]
-        self.last_time = time.time()
-        # Heuristic: If initial counters are zero, last_time should be slightly in the past
-        # to allow the first get_metrics call to establish a baseline without a tiny time_elapsed.
-        # However, a more robust way is to handle the first valid delta in get_metrics.
-        # For now, if initial counters are 0, the first speed calc might be total/small_time.
-        # This is often acceptable for a brief moment.
+        self.last_time = time.monotonic()
+
+    def _select_primary_nic(self) -> Optional[str]:
+        """Pick the busiest non-loopback adapter, so virtual/loopback counters aren't summed in"""
+        try:
+            per_nic = psutil.net_io_counters(pernic=True)
+        except Exception as e:
+            logger.warning(f"Could not enumerate network adapters: {e}")
+            return None
+
+        candidates = [(c.bytes_sent + c.bytes_recv, name) for name, c in per_nic.items() if not _is_loopback(name)]
+        if not candidates:
+            return None
+        primary = max(candidates)[1]
+        logger.info(f"Using network adapter '{primary}' for network metrics")
+        return primary
+
+    def _read_counters(self):
+        """Read the primary adapter's counters (all adapters combined if none was selected)"""
+        if self._primary_nic is None:
+            return psutil.net_io_counters()
+        counters = psutil.net_io_counters(pernic=True).get(self._primary_nic)
+        if counters is None:
+            # Adapter went away (unplugged, VPN down): pick a new one and restart the speed baseline
+            self._primary_nic = self._select_primary_nic()
+            if self._primary_nic is None:
+                counters = psutil.net_io_counters()
+            else:
+                counters = psutil.net_io_counters(pernic=True)[self._primary_nic]
+            self.last_bytes_sent = counters.bytes_sent
+            self.last_bytes_recv = counters.bytes_recv
+        return counters
 
     def _get_initial_psutil_counters(self) -> Tuple[int, int]:
         """Helper to get initial byte counters from psutil."""
         try:
-            counters = psutil.net_io_counters()
+            counters = self._read_counters()
             return counters.bytes_sent, counters.bytes_recv
         except Exception as e:
             logger.warning(f"Could not get initial psutil network counters: {e}")
@@ -56,36 +117,44 @@ class NetworkMetricsCollector:
             - total_sent: Total bytes sent in GB
             - total_received: Total bytes received in GB
         """
+        # Counter reads are costly on Windows and speeds over a tiny window are noise,
+        # so sub-interval polls reuse the last sample
+        current_time = time.monotonic()
+        if self._has_sample and current_time - self.last_time < max(self.min_interval, MIN_SPEED_WINDOW):
+            return self._metrics.copy()
+
         try:
-            net_counters = psutil.net_io_counters()
-            current_time = time.time()
+            net_counters = self._read_counters()
 
             # Calculate speeds
             time_elapsed = current_time - self.last_time
             bytes_sent = net_counters.bytes_sent
             bytes_recv = net_counters.bytes_recv
 
-            upload_speed = (bytes_sent - self.last_bytes_sent) / (
-                time_elapsed * 1024 * 1024
-            )  # MB/s
-            download_speed = (bytes_recv - self.last_bytes_recv) / (
-                time_elapsed * 1024 * 1024
-            )  # MB/s
+            if not self._has_sample or time_elapsed < MIN_SPEED_WINDOW:
+                upload_speed = None
+                download_speed = None
+            else:
+                # Counters can wrap or reset (adapter re-init); treat a negative delta as no traffic
+                inv_mb = 1.0 / (time_elapsed * _MB)
+                upload_speed = max(bytes_sent - self.last_bytes_sent, 0) * inv_mb  # MB/s
+                download_speed = max(bytes_recv - self.last_bytes_recv, 0) * inv_mb  # MB/s
 
-            metrics = {
-                "upload_speed": upload_speed,
-                "download_speed": download_speed,
-                "total_sent": bytes_sent / (1024**3),  # Convert to GB
-                "total_received": bytes_recv / (1024**3),  # Convert to GB
-            }
+            metrics = self._metrics
+            metrics["upload_speed"] = upload_speed
+            metrics["download_speed"] = download_speed
+            metrics["total_sent"] = bytes_sent / _GB  # Convert to GB
+            metrics["total_received"] = bytes_recv / _GB  # Convert to GB
 
             # Update last values
             self.last_bytes_sent = bytes_sent
             self.last_bytes_recv = bytes_recv
             self.last_time = current_time
+            self._has_sample = True
 
-            logger.debug(f"Network Metrics: {metrics}")
-            return metrics
+            if logger.isEnabledFor(logging.DEBUG): # Skip building the f-string every poll
+                logger.debug(f"Network Metrics: {metrics}")
+            return metrics.copy()
 
         except Exception as e:
             logger.error(f"Error getting network metrics from psutil: {e}")
@@ -96,26 +165,26 @@ class NetworkMetricsCollector:
                 "total_sent": None,
                 "total_received": None,
             }
-            # Reset last_bytes for psutil, so if it recovers, it doesn't use stale data for speed.
-            self.last_bytes_sent = 0 
-            self.last_bytes_recv = 0
+            # Re-baseline when psutil recovers, so it doesn't use stale data for speed.
+            self._has_sample = False
             # self.last_time is not reset here, it reflects the last known good time or init time.
 
-            if self.platform == "Windows" and LHM_WMI_AVAILABLE:
+            if IS_WINDOWS and LHM_WMI_AVAILABLE:
                 logger.info("Attempting to get network totals from LHM as psutil failed.")
                 lhm_totals = self._get_lhm_network_totals()
                 if lhm_totals:
                     if lhm_totals.get("lhm_total_sent") is not None:
-                        metrics["total_sent"] = lhm_totals["lhm_total_sent"] / (1024**3) # GB
+                        metrics["total_sent"] = lhm_totals["lhm_total_sent"] / _GB # GB
                     if lhm_totals.get("lhm_total_recv") is not None:
-                        metrics["total_received"] = lhm_totals["lhm_total_recv"] / (1024**3) # GB
+                        metrics["total_received"] = lhm_totals["lhm_total_recv"] / _GB # GB
             
-            logger.debug(f"Network Metrics (psutil failed, LHM fallback attempted): {metrics}")
+            logger.debug("Network Metrics (psutil failed, LHM fallback attempted): %s", metrics)
             return metrics
 
     def _get_lhm_network_totals(self) -> Optional[Dict[str, float]]:
-        """Get total network data sent/received from LHM sensors."""
-        if not LHM_WMI_AVAILABLE or WMIService is None:
+        """Get total network data sent/received from the shared LHM sensor snapshot."""
+        lhm = LHMSnapshot.get() if LHM_WMI_AVAILABLE else None
+        if lhm is None:
             logger.debug("LHM WMI not available for Network metrics.")
             return None
 
@@ -123,50 +192,25 @@ class NetworkMetricsCollector:
         lhm_total_recv_bytes = 0.0
         found_data = False
 
-        try:
-            conn = WMIService.WMI(namespace=r"root\LibreHardwareMonitor")
-            sensors = conn.Sensor() # This might be time-consuming if many sensors
-
-            for sensor in sensors:
-                if not hasattr(sensor, 'Value') or sensor.Value is None or \
-                   not hasattr(sensor, 'SensorType') or not hasattr(sensor, 'Name') or \
-                   not hasattr(sensor, 'Identifier') or not sensor.Identifier:
-                    continue
-                
-                # Filter for network adapter sensors first using Identifier
-                # Common identifiers: /lhmplugincommsnetworkadapter/{guid}/... or /lhmnetworkadapter/{guid}/...
-                # We are interested in hardware sensors, not per-process if LHM provides that.
-                sensor_id_lower = sensor.Identifier.lower()
-                if not ('/networkadapter/' in sensor_id_lower or '/lhmnetworkadapter/' in sensor_id_lower or '/lhmplugincommsnetworkadapter/' in sensor_id_lower):
-                    if not ('network' in sensor_id_lower or 'ethernet' in sensor_id_lower or 'wi-fi' in sensor_id_lower or 'wlan' in sensor_id_lower):
-                         continue # Skip non-network adapter related sensors based on identifier
-
-                s_type = sensor.SensorType.lower()
-                s_name = sensor.Name.lower()
-                
-                if s_type == "data": # LHM uses "Data" for byte counters
-                    # Example LHM Names: "Ethernet - Data Uploaded", "Wi-Fi - Data Downloaded"
-                    # Summing up all could be problematic if LHM reports virtual/loopback adapters.
-                    # A more robust way would be to identify the primary active adapter(s), but that's complex.
-                    # For now, sum all found "Data Uploaded/Downloaded" type sensors associated with network adapters.
-                    if "upload" in s_name or "sent" in s_name: 
-                        lhm_total_sent_bytes += float(sensor.Value)
-                        found_data = True
-                    elif "download" in s_name or "recv" in s_name or "received" in s_name: 
-                        lhm_total_recv_bytes += float(sensor.Value)
-                        found_data = True
-            
-            if found_data:
-                logger.debug(f"LHM Network Totals: Sent={lhm_total_sent_bytes}, Recv={lhm_total_recv_bytes}")
-                return {"lhm_total_sent": lhm_total_sent_bytes, "lhm_total_recv": lhm_total_recv_bytes}
-            else:
-                logger.debug("No suitable LHM network total data sensors found.")
-                return None
-
-        except AttributeError as ae: # Catch specific error if WMI object is not as expected (e.g. during shutdown)
-            logger.warning(f"AttributeError while querying LHM Network sensors (possibly WMI issue): {ae}")
-            return None
-        except Exception as e:
-            # Using a general exception type for WMI specific errors like pythoncom.com_error or wmi.x_wmi
-            logger.error(f"Error querying LHM Network sensors: {e} (Type: {type(e).__name__})")
+        # LHM uses "Data" for byte counters ("Ethernet - Data Uploaded", "Wi-Fi - Data Downloaded", ...);
+        # other hardware (RAM, drives) has "Data" sensors too, so only take network adapters' (/nic/...)
+        for identifier, (name, value) in lhm.sensors("Data").items():
+            if not identifier.startswith(LHM_NIC_PREFIX):
+                continue
+            # Summing up all could be problematic if LHM reports virtual/loopback adapters.
+            # A more robust way would be to identify the primary active adapter(s), but that's complex.
+            # For now, sum all "Data Uploaded/Downloaded" type sensors.
+            s_name = name.lower()
+            if "upload" in s_name or "sent" in s_name:
+                lhm_total_sent_bytes += value
+                found_data = True
+            elif "download" in s_name or "recv" in s_name or "received" in s_name:
+                lhm_total_recv_bytes += value
+                found_data = True
+
+        if found_data:
+            logger.debug("LHM Network Totals: Sent=%s, Recv=%s", lhm_total_sent_bytes, lhm_total_recv_bytes)
+            return {"lhm_total_sent": lhm_total_sent_bytes, "lhm_total_recv": lhm_total_recv_bytes}
+        else:
+            logger.debug("No suitable LHM network total data sensors found.")
             return None
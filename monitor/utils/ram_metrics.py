@@ -1,64 +1,44 @@
 import psutil
-import platform
-import time
+import logging
 from typing import Dict, Optional
+from ._platform import IS_WINDOWS
+from .lhm_snapshot import LHMSnapshot
 from .logging_utils import get_logger
 
-# Try to import wmi for Windows-specific LHM access
-try:
-    import wmi
-except ImportError:
-    wmi = None # WMI not available on non-Windows or if not installed
-
 # Configure logger
 logger = get_logger(__name__)
 
+# Bytes per GB
+_GB = 1 << 30
+
 class RAMMetricsCollector:
     """A class to handle RAM metrics collection across different platforms"""
 
     def __init__(self):
-        self.platform_system = platform.system()
+        # LHM readings come from the shared background sensor snapshot (Windows only)
+        self._lhm = LHMSnapshot.get() if IS_WINDOWS else None
+        # Reused across polls; callers get a copy
+        self._metrics = {
+            "total": None, 
+            "used": None, 
+            "available": None, 
+            "percent": None,
+            "ram_temperature": None # Initialize LHM specific metric
+        }
 
-    _lhm_ram_temp_cache = None
-    _lhm_ram_cache_time = 0
-    _lhm_ram_cache_ttl = 5 
-    
     def _get_lhm_ram_metrics(self) -> Optional[Dict[str, float]]:
-        """Get RAM metrics from LibreHardwareMonitor through WMI"""
-        if not wmi: # WMI not available
+        """Get RAM metrics from the shared LibreHardwareMonitor sensor snapshot"""
+        if self._lhm is None: # WMI not available
             logger.debug("LHM WMI not available for RAM metrics.")
             return None
-        
-        # Verificar si la caché es válida
-        current_time = time.time()
-        if (RAMMetricsCollector._lhm_ram_temp_cache is not None and 
-            current_time - RAMMetricsCollector._lhm_ram_cache_time < RAMMetricsCollector._lhm_ram_cache_ttl):
-            return {"ram_temperature": RAMMetricsCollector._lhm_ram_temp_cache}
-        
-        ram_temp = None
-        
-        try:
-            # Configurar timeout para operaciones WMI para evitar bloqueos en la UI
-            lhm_wmi_connection = wmi.WMI(namespace=r"root\LibreHardwareMonitor")
-            
-            wql = "SELECT Value FROM Sensor WHERE SensorType='Temperature' AND Name LIKE '%RAM%' OR Name LIKE '%Memory%'"
-            results = lhm_wmi_connection.query(wql)
-            
-            if results and len(results) > 0:
-                for result in results:
-                    if hasattr(result, 'Value') and result.Value is not None:
-                        ram_temp = result.Value
-                        break
-            
-            # Update cache
-            RAMMetricsCollector._lhm_ram_temp_cache = ram_temp
-            RAMMetricsCollector._lhm_ram_cache_time = current_time
-                    
-            return {"ram_temperature": ram_temp} if ram_temp is not None else None
-            
-        except Exception as e:
-            logger.error(f"Error getting RAM metrics from LHM: {e}")
-            return None
+
+        # First RAM/memory temperature; GPU memory sensors are named "GPU Memory" too, so skip GPU identifiers
+        ram_temp = next(
+            (value for identifier, (name, value) in self._lhm.sensors("Temperature").items()
+             if ("RAM" in name.upper() or "MEMORY" in name.upper()) and "gpu" not in identifier),
+            None
+        )
+        return {"ram_temperature": ram_temp} if ram_temp is not None else None
 
     def get_metrics(self) -> Dict[str, Optional[float]]:
         """Get RAM metrics
@@ -71,31 +51,26 @@ class RAMMetricsCollector:
             - percent: RAM usage percentage
             - ram_temperature: RAM temperature in Celsius (from LHM, Windows only)
         """
-        metrics = {
-            "total": None, 
-            "used": None, 
-            "available": None, 
-            "percent": None,
-            "ram_temperature": None # Initialize LHM specific metric
-        }
+        metrics = self._metrics
         
         try:
-            memory = psutil.virtual_memory()
-            metrics.update({
-                "total": memory.total / (1024**3),  # Convert to GB
-                "used": memory.used / (1024**3),
-                "available": memory.available / (1024**3),
-                "percent": memory.percent,
-            })
+            # svmem always starts with (total, available, percent, used) on every platform
+            total, available, percent, used = psutil.virtual_memory()[:4]
+            metrics["total"] = total / _GB  # Convert to GB
+            metrics["used"] = used / _GB
+            metrics["available"] = available / _GB
+            metrics["percent"] = percent
         except Exception as e:
             logger.error(f"Error getting psutil RAM metrics: {e}")
-            # metrics will retain None for these keys
+            metrics["total"] = metrics["used"] = metrics["available"] = metrics["percent"] = None
 
-        if self.platform_system == "Windows":
+        if IS_WINDOWS:
+            # Read from the LHM snapshot; no WMI call on this path
             lhm_ram_metrics = self._get_lhm_ram_metrics()
-            if lhm_ram_metrics.get("ram_temperature") is not None:
-                 metrics["ram_temperature"] = lhm_ram_metrics["ram_temperature"]
+            # A sensor that went away must not leave its last reading behind
+            metrics["ram_temperature"] = lhm_ram_metrics["ram_temperature"] if lhm_ram_metrics else None
             # Update other LHM specific metrics if any were added and are valid
 
-        logger.debug(f"RAM Metrics: {metrics}")
-        return metrics
+        if logger.isEnabledFor(logging.DEBUG): # Skip building the f-string every poll
+            logger.debug(f"RAM Metrics: {metrics}")
+        return metrics.copy()
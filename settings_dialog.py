@@ -8,16 +8,210 @@ of the hardware monitor desktop widget.
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, 
                            QLabel, QSlider, QComboBox, QCheckBox, QSpinBox,
                            QPushButton, QColorDialog, QFontDialog, QGroupBox,
-                           QFormLayout, QFrame, QListWidget, QListWidgetItem,
+                           QFormLayout, QFrame, QListWidget,
                            QRadioButton, QApplication, QWidget)
-from PyQt6.QtCore import Qt, QSettings
-from PyQt6.QtGui import QColor, QFont, QPalette
-import copy
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont
+from functools import lru_cache, partial
+
+from src.core.config_manager import _fresh_defaults
+
+# Item data role holding each order list row's key
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+# Text colors used on color buttons, chosen by the background's lightness
+_LIGHT_TEXT = "#FFFFFF"
+_DARK_TEXT = "#000000"
+
+
+@lru_cache(maxsize=64)
+def _qcolor(color_str):
+    """QColor for a color string, cached; treat the result as read-only"""
+    return QColor(color_str)
+
+
+@lru_cache(maxsize=16)
+def _qfont(family, size):
+    """QFont for a family and point size, cached; treat the result as read-only"""
+    return QFont(family, size)
+
+
+# Position combo entries: config value -> index, and the label of each index
+_POSITION_MAP = {"top-left": 0, "top-right": 1, "bottom-left": 2, "bottom-right": 3, "center": 4, "custom": 5}
+_POSITIONS = tuple(_POSITION_MAP)
+_POSITION_LABELS = ("Top Left", "Top Right", "Bottom Left", "Bottom Right", "Center", "Custom")
+
+# Refresh rate combo entries (seconds), their labels and index lookup
+_REFRESH_RATES = (0.5, 1.0, 2.0, 5.0)
+_REFRESH_LABELS = tuple(f"{rate} seconds" for rate in _REFRESH_RATES)
+_REFRESH_INDEX = {rate: i for i, rate in enumerate(_REFRESH_RATES)}
+
+# Component order list rows as (label, component key, default order)
+_COMPONENT_ROWS = (("CPU", "cpu", 0), ("GPU", "gpu", 1), ("RAM", "ram", 2), ("Network", "network", 3))
+
+def _form(parent):
+    """Create a QFormLayout with the dialog's growth, wrap and spacing settings set up front"""
+    layout = QFormLayout(parent)
+    layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+    layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.DontWrapRows)
+    layout.setHorizontalSpacing(6)
+    layout.setVerticalSpacing(4)
+    return layout
+
+
+# Widget values saved by get_config and restored by reset_defaults, per top-level
+# tab (in tab order), as (config section, key, widget attribute, getter taking the
+# widget, setter taking the widget and the config value)
+_TAB_BINDINGS = (
+    # Appearance tab
+    (
+        ("appearance", "opacity", "opacity_slider",
+         lambda w: w.value() / 100.0, lambda w, v: w.setValue(int(v * 100))),
+        ("appearance", "padding", "padding_spin", QSpinBox.value, QSpinBox.setValue),
+        ("appearance", "show_border", "show_border_checkbox", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("appearance", "position", "position_combo",
+         lambda w: _POSITIONS[w.currentIndex()], lambda w, v: w.setCurrentIndex(_POSITION_MAP.get(v, 3))),
+        ("appearance", "monitor_index", "monitor_combo",
+         QComboBox.currentIndex, lambda w, v: w.setCurrentIndex(v if v < w.count() else w.currentIndex())),
+        ("appearance", "refresh_rate", "refresh_combo",
+         lambda w: _REFRESH_RATES[w.currentIndex()], lambda w, v: w.setCurrentIndex(_REFRESH_INDEX.get(v, 1))),
+    ),
+    # Display tab (the detailed metric checkboxes are handled through _checkbox_by_key)
+    (
+        ("display", "show_cpu", "show_cpu", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("display", "show_gpu", "show_gpu", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("display", "show_ram", "show_ram", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("display", "show_network", "show_network", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("display", "show_titles", "show_titles", QCheckBox.isChecked, QCheckBox.setChecked),
+        ("display", "compact_mode", "compact_mode", QCheckBox.isChecked, QCheckBox.setChecked),
+    ),
+    # Layout tab (the layout type and component order are handled separately)
+    (
+        ("layout", "columns", "grid_columns", QSpinBox.value, QSpinBox.setValue),
+        ("layout", "spacing", "spacing_spin", QSpinBox.value, QSpinBox.setValue),
+        ("appearance", "offset_x", "x_offset", QSpinBox.value, QSpinBox.setValue),
+        ("appearance", "offset_y", "y_offset", QSpinBox.value, QSpinBox.setValue),
+    ),
+    # Metrics Order tab (list orders only)
+    (),
+)
+
+# Orderable metric keys of each component, in their default order
+COMPONENT_METRIC_KEYS = {
+    "cpu": ("cpu_usage", "cpu_temperature", "cpu_frequency", "cpu_voltage"),
+    "gpu": ("gpu_core_usage", "gpu_core_temperature", "gpu_core_frequency",
+            "gpu_memory_frequency", "gpu_memory_temperature", "gpu_hotspot_temperature",
+            "gpu_vram_usage", "gpu_vram_memory", "gpu_fan_speed"),
+    "ram": ("ram_percent", "ram_used_total", "ram_available", "ram_temperature"),
+    "network": ("network_upload_speed", "network_download_speed",
+                "network_total_sent", "network_total_received"),
+}
+
+# Names shown in the metric ordering lists
+METRIC_DISPLAY_NAMES = {
+    "cpu_usage": "CPU Usage",
+    "cpu_temperature": "CPU Temperature",
+    "cpu_frequency": "CPU Frequency",
+    "cpu_voltage": "CPU Voltage",
+    "gpu_core_usage": "GPU Core Usage",
+    "gpu_core_temperature": "GPU Core Temperature",
+    "gpu_core_frequency": "GPU Core Frequency",
+    "gpu_memory_frequency": "GPU Memory Frequency",
+    "gpu_memory_temperature": "GPU Memory Temperature",
+    "gpu_hotspot_temperature": "GPU Hotspot Temperature",
+    "gpu_vram_usage": "GPU VRAM usage",
+    "gpu_vram_memory": "GPU VRAM Memory",
+    "gpu_fan_speed": "GPU Fan Speed",
+    "ram_percent": "RAM Usage Percent",
+    "ram_used_total": "RAM Used/Total",
+    "ram_available": "RAM Available",
+    "ram_temperature": "RAM Temperature",
+    "network_upload_speed": "Upload Speed",
+    "network_download_speed": "Download Speed",
+    "network_total_sent": "Total Sent",
+    "network_total_received": "Total Received",
+}
+
+
+def _fill_order_list(list_widget, rows):
+    """Replace a list's rows with (display name, key) rows, each key stored as UserRole data"""
+    list_widget.clear()
+    # Add all rows in one batch, then tag each with its key
+    list_widget.addItems([name for name, _ in rows])
+    item = list_widget.item
+    for i, (_, key) in enumerate(rows):
+        item(i).setData(_USER_ROLE, key)
+
+
+def _collect_order(list_widget, order):
+    """Store each row's key (its UserRole data) in order, mapped to the row index"""
+    item = list_widget.item
+    order.update((item(i).data(_USER_ROLE), i) for i in range(list_widget.count()))
+
+
+def _copy_config(config):
+    """Copy a config dict: its sections, and the dicts/lists inside them, are copied
+    
+    Config values are JSON primitives at most two levels deep, so this is
+    equivalent to a deepcopy without its per-leaf recursion and memo bookkeeping.
+    """
+    copied = {}
+    for section, values in config.items():
+        if isinstance(values, dict):
+            copied[section] = {
+                key: dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+                for key, value in values.items()
+            }
+        else:
+            copied[section] = values
+    return copied
 
 
 class SettingsDialog(QDialog):
     """Dialog for configuring the hardware monitor widget"""
     
+    # Detailed metric checkboxes as (label, metric_key); each is stored as
+    # self.show_<metric_key> and saved to config["display"]["show_<metric_key>"]
+    CPU_METRICS = (
+        ("Show CPU Usage", "cpu_usage"),
+        ("Show CPU Temperature", "cpu_temperature"),
+        ("Show CPU Frequency", "cpu_frequency"),
+        ("Show CPU Voltage", "cpu_voltage"),
+    )
+    GPU_CORE_METRICS = (
+        ("Show GPU Core Usage", "gpu_core_usage"),
+        ("Show GPU Core Temperature", "gpu_core_temperature"),
+        ("Show GPU Core Frequency", "gpu_core_frequency"),
+        ("Show GPU Hotspot Temperature", "gpu_hotspot_temperature"),
+    )
+    GPU_MEMORY_METRICS = (
+        ("Show GPU Memory Frequency", "gpu_memory_frequency"),
+        ("Show GPU Memory Temperature", "gpu_memory_temperature"),
+        ("Show GPU VRAM usage Percentage", "gpu_vram_usage"),
+        ("Show GPU VRAM Used/Total", "gpu_vram_memory"),
+    )
+    GPU_OTHER_METRICS = (
+        ("Show GPU Fan Speed", "gpu_fan_speed"),
+    )
+    RAM_METRICS = (
+        ("Show RAM Usage Percent", "ram_percent"),
+        ("Show RAM Used/Total", "ram_used_total"),
+        ("Show RAM Available", "ram_available"),
+        ("Show RAM Temperature", "ram_temperature"),
+    )
+    NETWORK_SPEED_METRICS = (
+        ("Show Upload Speed", "network_upload_speed"),
+        ("Show Download Speed", "network_download_speed"),
+    )
+    NETWORK_TOTAL_METRICS = (
+        ("Show Total Sent", "network_total_sent"),
+        ("Show Total Received", "network_total_received"),
+    )
+    
+    # Monitor combo entries, shared by every dialog until a screen is added or removed
+    _cached_screen_names = None
+    _watching_screens = False
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Hardware Monitor Settings")
@@ -25,29 +219,67 @@ class SettingsDialog(QDialog):
         
         # Store original config and create a working copy
         self.original_config = config
-        self.config = copy.deepcopy(config)
+        self._set_working_config(_copy_config(config))
+        
+        # Detailed metric checkboxes by config key, filled as their pages are built
+        self._checkbox_by_key = {}
         
         # Setup UI
         self.setup_ui()
     
+    def _set_working_config(self, config):
+        """Make a config copy the one the dialog edits, filling in what its readers expect"""
+        self.config = config
+        
+        # Older configs may lack the layout section or its order maps; create them
+        # once so every reader can index them directly
+        layout = config.setdefault("layout", {})
+        layout.setdefault("component_order", {})
+        metric_order = layout.setdefault("metric_order", {})
+        
+        # Metric keys of each component in their configured order (unordered keys last)
+        self._sorted_metric_keys = {
+            component: sorted(keys, key=lambda key: metric_order.get(key, 999))
+            for component, keys in COMPONENT_METRIC_KEYS.items()
+        }
+    
+    @classmethod
+    def _screen_names(cls):
+        """Get the monitor combo entries, enumerating the screens only when they changed"""
+        if cls._cached_screen_names is None:
+            if not cls._watching_screens:
+                # Drop the cached list whenever the set of screens changes
+                app = QApplication.instance()
+                app.screenAdded.connect(cls._invalidate_screen_names)
+                app.screenRemoved.connect(cls._invalidate_screen_names)
+                cls._watching_screens = True
+            cls._cached_screen_names = [
+                f"Monitor {i+1}: {screen.name()}" for i, screen in enumerate(QApplication.screens())
+            ]
+        return cls._cached_screen_names
+    
+    @classmethod
+    def _invalidate_screen_names(cls, screen=None):
+        """Forget the cached monitor combo entries"""
+        cls._cached_screen_names = None
+    
     def setup_ui(self):
         """Set up the settings dialog UI"""
         main_layout = QVBoxLayout(self)
         
-        # Create tab widget
-        tabs = QTabWidget()
-        
-        # Create tabs
-        appearance_tab = self.create_appearance_tab()
-        display_tab = self.create_display_tab()
-        layout_tab = self.create_layout_tab()
-        
-        # Add tabs
-        tabs.addTab(appearance_tab, "Appearance")
-        tabs.addTab(display_tab, "Display")
-        tabs.addTab(layout_tab, "Layout")
-        metrics_order_tab = self.create_metrics_order_tab()
-        tabs.addTab(metrics_order_tab, "Metrics Order")
+        # Suspend repaints while populating, so the dialog lays out once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # Create tab widget; only the visible tab is built now, the rest on first visit
+            tabs = QTabWidget()
+            self._tabs_built, _ = self._add_lazy_tabs(tabs, [
+                (self.create_appearance_tab, "Appearance"),
+                (self.create_display_tab, "Display"),
+                (self.create_layout_tab, "Layout"),
+                (self.create_metrics_order_tab, "Metrics Order"),
+            ])
+        finally:
+            self.setUpdatesEnabled(True)
         
         # Add tab widget to layout
         main_layout.addWidget(tabs)
@@ -71,24 +303,72 @@ class SettingsDialog(QDialog):
         
         main_layout.addLayout(button_layout)
     
+    def _add_lazy_tabs(self, tab_widget, pages, enabled=None):
+        """Add placeholder pages to a tab widget and build each real page the first time it is shown
+        
+        Disabled pages stay placeholders until they are enabled again; the caller
+        then calls the returned ensure_built(index) to build one that is on screen.
+        
+        Args:
+            tab_widget: The QTabWidget to populate
+            pages: List of (builder, title) tuples, builder returning the page widget
+            enabled: Optional list of initial per-page enabled states
+            
+        Returns:
+            (built, ensure_built): per-page flags, True once that page has been
+            built, and the function building a page by index
+        """
+        built = [False] * len(pages)
+        
+        def ensure_built(index):
+            if index < 0 or built[index]:
+                return
+            if not tab_widget.widget(index).isEnabled():
+                return
+            built[index] = True
+            builder, title = pages[index]
+            placeholder = tab_widget.widget(index)
+            # Populate and swap the page without repainting in between
+            tab_widget.setUpdatesEnabled(False)
+            try:
+                page = builder()
+                # Carry over state set on the placeholder (e.g. a disabled component page)
+                page.setEnabled(placeholder.isEnabled())
+                # Swapping the page moves the current index, don't re-enter while doing it
+                tab_widget.blockSignals(True)
+                tab_widget.removeTab(index)
+                tab_widget.insertTab(index, page, title)
+                tab_widget.setCurrentIndex(index)
+                tab_widget.blockSignals(False)
+            finally:
+                tab_widget.setUpdatesEnabled(True)
+            placeholder.deleteLater()
+        
+        for i, (_, title) in enumerate(pages):
+            placeholder = QWidget()
+            if enabled is not None:
+                placeholder.setEnabled(enabled[i])
+            tab_widget.addTab(placeholder, title)
+        tab_widget.currentChanged.connect(ensure_built)
+        ensure_built(tab_widget.currentIndex())
+        return built, ensure_built
+    
     def create_appearance_tab(self):
         """Create the appearance settings tab"""
+        ap = self.config["appearance"]
         tab = QFrame()
         layout = QVBoxLayout(tab)
         
         # Font settings
         font_group = QGroupBox("Font")
-        font_layout = QFormLayout(font_group)
+        font_layout = _form(font_group)
         
         # Font picker button
         self.font_button = QPushButton("Change Font...")
         self.font_button.clicked.connect(self.pick_font)
         
         # Show current font
-        current_font = QFont(
-            self.config["appearance"]["font_family"],
-            self.config["appearance"]["font_size"]
-        )
+        current_font = _qfont(ap["font_family"], ap["font_size"])
         self.font_button.setFont(current_font)
         self.font_button.setText(f"{current_font.family()}, {current_font.pointSize()}pt")
         
@@ -97,19 +377,17 @@ class SettingsDialog(QDialog):
         
         # Color settings
         color_group = QGroupBox("Colors")
-        color_layout = QFormLayout(color_group)
+        color_layout = _form(color_group)
         
         # Text color button
         self.text_color_button = QPushButton()
-        self.text_color_button.setAutoFillBackground(True)
-        self.set_button_color(self.text_color_button, self.config["appearance"]["font_color"])
+        self.set_button_color(self.text_color_button, ap["font_color"])
         self.text_color_button.clicked.connect(self.pick_text_color)
         color_layout.addRow("Text Color:", self.text_color_button)
         
         # Border color button and checkbox
         self.border_color_button = QPushButton()
-        self.border_color_button.setAutoFillBackground(True)
-        self.set_button_color(self.border_color_button, self.config["appearance"].get("border_color", "#000000"))
+        self.set_button_color(self.border_color_button, ap.get("border_color", "#000000"))
         self.border_color_button.clicked.connect(self.pick_border_color)
         
         # Create a layout for border options
@@ -117,7 +395,7 @@ class SettingsDialog(QDialog):
         
         # Add a checkbox to enable/disable border
         self.show_border_checkbox = QCheckBox("Show Border")
-        self.show_border_checkbox.setChecked(self.config["appearance"].get("show_border", False))
+        self.show_border_checkbox.setChecked(ap.get("show_border", False))
         border_layout.addWidget(self.show_border_checkbox)
         border_layout.addWidget(self.border_color_button)
         
@@ -127,19 +405,25 @@ class SettingsDialog(QDialog):
         
         # Opacity settings
         opacity_group = QGroupBox("Opacity")
-        opacity_layout = QFormLayout(opacity_group)
+        opacity_layout = _form(opacity_group)
         
         self.opacity_slider = QSlider(Qt.Orientation.Horizontal)
         self.opacity_slider.setMinimum(10)  # 10% opacity minimum
         self.opacity_slider.setMaximum(100)
-        self.opacity_slider.setValue(int(self.config["appearance"]["opacity"] * 100))
+        self.opacity_slider.setValue(int(ap["opacity"] * 100))
         self.opacity_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.opacity_slider.setTickInterval(10)
         
-        self.opacity_label = QLabel(f"{self.opacity_slider.value()}%")
-        self.opacity_slider.valueChanged.connect(
-            lambda value: self.opacity_label.setText(f"{value}%")
-        )
+        # Read-only percent readout driven straight by the slider's signal, so dragging
+        # doesn't run any Python per step
+        self.opacity_label = QSpinBox()
+        self.opacity_label.setRange(10, 100)
+        self.opacity_label.setSuffix("%")
+        self.opacity_label.setReadOnly(True)
+        self.opacity_label.setButtonSymbols(QSpinBox.ButtonSymbols.NoButtons)
+        self.opacity_label.setFrame(False)
+        self.opacity_label.setValue(self.opacity_slider.value())
+        self.opacity_slider.valueChanged.connect(self.opacity_label.setValue)
         
         opacity_layout.addRow("Font Opacity:", self.opacity_slider)
         opacity_layout.addRow("", self.opacity_label)
@@ -148,26 +432,23 @@ class SettingsDialog(QDialog):
         
         # Position settings
         position_group = QGroupBox("Position")
-        position_layout = QFormLayout(position_group)
+        position_layout = _form(position_group)
         
         # Create position combo box
         self.position_combo = QComboBox()
-        self.position_combo.addItems(["Top Left", "Top Right", "Bottom Left", "Bottom Right", "Center", "Custom"])
+        self.position_combo.addItems(_POSITION_LABELS)
         
         # Set current position
-        position_map = {"top-left": 0, "top-right": 1, "bottom-left": 2, "bottom-right": 3, "center": 4, "custom": 5}
-        current_position = self.config["appearance"]["position"]
-        self.position_combo.setCurrentIndex(position_map.get(current_position, 3))  # Default to bottom-right
+        self.position_combo.setCurrentIndex(_POSITION_MAP.get(ap["position"], 3))  # Default to bottom-right
         position_layout.addRow("Position:", self.position_combo)
         
         # Monitor selection
         self.monitor_combo = QComboBox()
         # Get available screens from the application
-        screens = QApplication.screens()
-        self.monitor_combo.addItems([f"Monitor {i+1}: {screen.name()}" for i, screen in enumerate(screens)])
+        self.monitor_combo.addItems(self._screen_names())
         
         # Set current monitor
-        current_monitor = self.config["appearance"].get("monitor_index", 0)
+        current_monitor = ap.get("monitor_index", 0)
         if current_monitor < self.monitor_combo.count():
             self.monitor_combo.setCurrentIndex(current_monitor)
         position_layout.addRow("Monitor:", self.monitor_combo)
@@ -176,36 +457,20 @@ class SettingsDialog(QDialog):
         self.padding_spin = QSpinBox()
         self.padding_spin.setMinimum(0)
         self.padding_spin.setMaximum(50)
-        self.padding_spin.setValue(self.config["appearance"]["padding"])
+        self.padding_spin.setValue(ap["padding"])
         position_layout.addRow("Padding:", self.padding_spin)
         
-        # Fine-tuning position with offset X and Y (without limits)
-        self.offset_x_spin = QSpinBox()
-        self.offset_x_spin.setMinimum(-10000)  # Very large negative value
-        self.offset_x_spin.setMaximum(10000)   # Very large positive value
-        self.offset_x_spin.setValue(self.config["appearance"].get("offset_x", 0))
-        position_layout.addRow("X Offset:", self.offset_x_spin)
-        
-        self.offset_y_spin = QSpinBox()
-        self.offset_y_spin.setMinimum(-10000)  # Very large negative value
-        self.offset_y_spin.setMaximum(10000)   # Very large positive value
-        self.offset_y_spin.setValue(self.config["appearance"].get("offset_y", 0))
-        position_layout.addRow("Y Offset:", self.offset_y_spin)
-        
         layout.addWidget(position_group)
         
         # Refresh rate
         refresh_group = QGroupBox("Refresh Rate")
-        refresh_layout = QFormLayout(refresh_group)
+        refresh_layout = _form(refresh_group)
         
         self.refresh_combo = QComboBox()
-        refresh_rates = [0.5, 1.0, 2.0, 5.0]
-        self.refresh_combo.addItems([f"{rate} seconds" for rate in refresh_rates])
+        self.refresh_combo.addItems(_REFRESH_LABELS)
         
         # Set current refresh rate
-        current_rate = self.config["appearance"]["refresh_rate"]
-        index = refresh_rates.index(current_rate) if current_rate in refresh_rates else 1  # Default to 1.0
-        self.refresh_combo.setCurrentIndex(index)
+        self.refresh_combo.setCurrentIndex(_REFRESH_INDEX.get(ap["refresh_rate"], 1))  # Default to 1.0
         
         refresh_layout.addRow("Update Interval:", self.refresh_combo)
         layout.addWidget(refresh_group)
@@ -215,6 +480,7 @@ class SettingsDialog(QDialog):
     
     def create_display_tab(self):
         """Create the display settings tab"""
+        disp = self.config["display"]
         tab = QFrame()
         layout = QVBoxLayout(tab)
         
@@ -224,23 +490,19 @@ class SettingsDialog(QDialog):
         
         # Main components checkboxes
         self.show_cpu = QCheckBox("CPU")
-        self.show_cpu.setChecked(self.config["display"]["show_cpu"])
-        self.show_cpu.stateChanged.connect(self._on_main_component_toggled)
+        self.show_cpu.setChecked(disp["show_cpu"])
         components_layout.addWidget(self.show_cpu)
         
         self.show_gpu = QCheckBox("GPU")
-        self.show_gpu.setChecked(self.config["display"]["show_gpu"])
-        self.show_gpu.stateChanged.connect(self._on_main_component_toggled)
+        self.show_gpu.setChecked(disp["show_gpu"])
         components_layout.addWidget(self.show_gpu)
         
         self.show_ram = QCheckBox("RAM")
-        self.show_ram.setChecked(self.config["display"]["show_ram"])
-        self.show_ram.stateChanged.connect(self._on_main_component_toggled)
+        self.show_ram.setChecked(disp["show_ram"])
         components_layout.addWidget(self.show_ram)
         
         self.show_network = QCheckBox("Network")
-        self.show_network.setChecked(self.config["display"]["show_network"])
-        self.show_network.stateChanged.connect(self._on_main_component_toggled)
+        self.show_network.setChecked(disp["show_network"])
         components_layout.addWidget(self.show_network)
         
         layout.addWidget(components_group)
@@ -250,151 +512,101 @@ class SettingsDialog(QDialog):
         options_layout = QVBoxLayout(options_group)
         
         self.show_titles = QCheckBox("Show Section Titles")
-        self.show_titles.setChecked(self.config["display"]["show_titles"])
+        self.show_titles.setChecked(disp["show_titles"])
         options_layout.addWidget(self.show_titles)
         
         self.compact_mode = QCheckBox("Compact Mode")
-        self.compact_mode.setChecked(self.config["display"]["compact_mode"])
+        self.compact_mode.setChecked(disp["compact_mode"])
         options_layout.addWidget(self.compact_mode)
         
         layout.addWidget(options_group)
         
-        # Create detailed metric options for each component
+        # Create detailed metric options for each component. Each page is built on
+        # first visit, and not at all while its component is switched off.
         self.tabs_detailed = QTabWidget()
+        _, self._build_detail_page = self._add_lazy_tabs(self.tabs_detailed, [
+            (self.create_cpu_metrics_page, "CPU Metrics"),
+            (self.create_gpu_metrics_page, "GPU Metrics"),
+            (self.create_ram_metrics_page, "RAM Metrics"),
+            (self.create_network_metrics_page, "Network Metrics"),
+        ], enabled=[disp["show_cpu"], disp["show_gpu"], disp["show_ram"], disp["show_network"]])
+        
+        # Connect only now that the checkboxes hold their initial state and the
+        # detail pages exist, so construction doesn't fire the slot
+        for index, checkbox in enumerate((self.show_cpu, self.show_gpu, self.show_ram, self.show_network)):
+            checkbox.toggled.connect(partial(self._on_main_component_toggled, index))
         
-        # CPU metrics tab
+        layout.addWidget(self.tabs_detailed)
+        
+        layout.addStretch()
+        return tab
+    
+    def _add_checkboxes(self, layout, disp, specs):
+        """Add one checkbox per (label, metric_key) spec, stored as self.show_<metric_key>"""
+        for label, metric_key in specs:
+            attr = f"show_{metric_key}"
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(disp[attr])
+            layout.addWidget(checkbox)
+            setattr(self, attr, checkbox)
+            self._checkbox_by_key[attr] = checkbox
+    
+    def create_cpu_metrics_page(self):
+        """Create the detailed CPU metrics page of the display tab"""
         cpu_tab = QFrame()
         cpu_layout = QVBoxLayout(cpu_tab)
         
         cpu_layout.addWidget(QLabel("<b>CPU Metrics</b>"))
+        self._add_checkboxes(cpu_layout, self.config["display"], self.CPU_METRICS)
         
-        self.show_cpu_usage = QCheckBox("Show CPU Usage")
-        self.show_cpu_usage.setChecked(self.config["display"]["show_cpu_usage"])
-        cpu_layout.addWidget(self.show_cpu_usage)
-        
-        self.show_cpu_temperature = QCheckBox("Show CPU Temperature")
-        self.show_cpu_temperature.setChecked(self.config["display"]["show_cpu_temperature"])
-        cpu_layout.addWidget(self.show_cpu_temperature)
-        
-        self.show_cpu_frequency = QCheckBox("Show CPU Frequency")
-        self.show_cpu_frequency.setChecked(self.config["display"]["show_cpu_frequency"])
-        cpu_layout.addWidget(self.show_cpu_frequency)
-        
-        self.show_cpu_voltage = QCheckBox("Show CPU Voltage")
-        self.show_cpu_voltage.setChecked(self.config["display"]["show_cpu_voltage"])
-        cpu_layout.addWidget(self.show_cpu_voltage)
-        
-        cpu_tab.setEnabled(self.config["display"]["show_cpu"])
-        self.tabs_detailed.addTab(cpu_tab, "CPU Metrics")
-        
-        # GPU metrics tab
+        return cpu_tab
+    
+    def create_gpu_metrics_page(self):
+        """Create the detailed GPU metrics page of the display tab"""
+        disp = self.config["display"]
         gpu_tab = QFrame()
         gpu_layout = QVBoxLayout(gpu_tab)
         
         gpu_layout.addWidget(QLabel("<b>GPU Core Metrics</b>"))
-        
-        self.show_gpu_core_usage = QCheckBox("Show GPU Core Usage")
-        self.show_gpu_core_usage.setChecked(self.config["display"]["show_gpu_core_usage"])
-        gpu_layout.addWidget(self.show_gpu_core_usage)
-        
-        self.show_gpu_core_temperature = QCheckBox("Show GPU Core Temperature")
-        self.show_gpu_core_temperature.setChecked(self.config["display"]["show_gpu_core_temperature"])
-        gpu_layout.addWidget(self.show_gpu_core_temperature)
-        
-        self.show_gpu_core_frequency = QCheckBox("Show GPU Core Frequency")
-        self.show_gpu_core_frequency.setChecked(self.config["display"]["show_gpu_core_frequency"])
-        gpu_layout.addWidget(self.show_gpu_core_frequency)
-        
-        self.show_gpu_hotspot_temperature = QCheckBox("Show GPU Hotspot Temperature")
-        self.show_gpu_hotspot_temperature.setChecked(self.config["display"]["show_gpu_hotspot_temperature"])
-        gpu_layout.addWidget(self.show_gpu_hotspot_temperature)
+        self._add_checkboxes(gpu_layout, disp, self.GPU_CORE_METRICS)
         
         gpu_layout.addWidget(QLabel("<b>GPU Memory Metrics</b>"))
-        
-        self.show_gpu_memory_frequency = QCheckBox("Show GPU Memory Frequency")
-        self.show_gpu_memory_frequency.setChecked(self.config["display"]["show_gpu_memory_frequency"])
-        gpu_layout.addWidget(self.show_gpu_memory_frequency)
-        
-        self.show_gpu_memory_temperature = QCheckBox("Show GPU Memory Temperature")
-        self.show_gpu_memory_temperature.setChecked(self.config["display"]["show_gpu_memory_temperature"])
-        gpu_layout.addWidget(self.show_gpu_memory_temperature)
-        
-        self.show_gpu_vram_usage = QCheckBox("Show GPU VRAM usage Percentage")
-        self.show_gpu_vram_usage.setChecked(self.config["display"]["show_gpu_vram_usage"])
-        gpu_layout.addWidget(self.show_gpu_vram_usage)
-        
-        self.show_gpu_vram_memory = QCheckBox("Show GPU VRAM Used/Total")
-        self.show_gpu_vram_memory.setChecked(self.config["display"]["show_gpu_vram_memory"])
-        gpu_layout.addWidget(self.show_gpu_vram_memory)
+        self._add_checkboxes(gpu_layout, disp, self.GPU_MEMORY_METRICS)
         
         gpu_layout.addWidget(QLabel("<b>GPU Other Metrics</b>"))
+        self._add_checkboxes(gpu_layout, disp, self.GPU_OTHER_METRICS)
         
-        self.show_gpu_fan_speed = QCheckBox("Show GPU Fan Speed")
-        self.show_gpu_fan_speed.setChecked(self.config["display"]["show_gpu_fan_speed"])
-        gpu_layout.addWidget(self.show_gpu_fan_speed)
-        
-        gpu_tab.setEnabled(self.config["display"]["show_gpu"])
-        self.tabs_detailed.addTab(gpu_tab, "GPU Metrics")
-        
-        # RAM metrics tab
+        return gpu_tab
+    
+    def create_ram_metrics_page(self):
+        """Create the detailed RAM metrics page of the display tab"""
         ram_tab = QFrame()
         ram_layout = QVBoxLayout(ram_tab)
         
         ram_layout.addWidget(QLabel("<b>RAM Metrics</b>"))
+        self._add_checkboxes(ram_layout, self.config["display"], self.RAM_METRICS)
         
-        self.show_ram_percent = QCheckBox("Show RAM Usage Percent")
-        self.show_ram_percent.setChecked(self.config["display"]["show_ram_percent"])
-        ram_layout.addWidget(self.show_ram_percent)
-        
-        self.show_ram_used_total = QCheckBox("Show RAM Used/Total")
-        self.show_ram_used_total.setChecked(self.config["display"]["show_ram_used_total"])
-        ram_layout.addWidget(self.show_ram_used_total)
-        
-        self.show_ram_available = QCheckBox("Show RAM Available")
-        self.show_ram_available.setChecked(self.config["display"]["show_ram_available"])
-        ram_layout.addWidget(self.show_ram_available)
-        
-        self.show_ram_temperature = QCheckBox("Show RAM Temperature")
-        self.show_ram_temperature.setChecked(self.config["display"]["show_ram_temperature"])
-        ram_layout.addWidget(self.show_ram_temperature)
-        
-        ram_tab.setEnabled(self.config["display"]["show_ram"])
-        self.tabs_detailed.addTab(ram_tab, "RAM Metrics")
-        
-        # Network metrics tab
+        return ram_tab
+    
+    def create_network_metrics_page(self):
+        """Create the detailed Network metrics page of the display tab"""
+        disp = self.config["display"]
         network_tab = QFrame()
         network_layout = QVBoxLayout(network_tab)
         
         network_layout.addWidget(QLabel("<b>Network Speed Metrics</b>"))
-        
-        self.show_network_upload_speed = QCheckBox("Show Upload Speed")
-        self.show_network_upload_speed.setChecked(self.config["display"]["show_network_upload_speed"])
-        network_layout.addWidget(self.show_network_upload_speed)
-        
-        self.show_network_download_speed = QCheckBox("Show Download Speed")
-        self.show_network_download_speed.setChecked(self.config["display"]["show_network_download_speed"])
-        network_layout.addWidget(self.show_network_download_speed)
+        self._add_checkboxes(network_layout, disp, self.NETWORK_SPEED_METRICS)
         
         network_layout.addWidget(QLabel("<b>Network Total Metrics</b>"))
+        self._add_checkboxes(network_layout, disp, self.NETWORK_TOTAL_METRICS)
         
-        self.show_network_total_sent = QCheckBox("Show Total Sent")
-        self.show_network_total_sent.setChecked(self.config["display"]["show_network_total_sent"])
-        network_layout.addWidget(self.show_network_total_sent)
-        
-        self.show_network_total_received = QCheckBox("Show Total Received")
-        self.show_network_total_received.setChecked(self.config["display"]["show_network_total_received"])
-        network_layout.addWidget(self.show_network_total_received)
-        
-        network_tab.setEnabled(self.config["display"]["show_network"])
-        self.tabs_detailed.addTab(network_tab, "Network Metrics")
-        
-        layout.addWidget(self.tabs_detailed)
-        
-        layout.addStretch()
-        return tab
+        return network_tab
     
     def create_layout_tab(self):
         """Create the layout settings tab"""
+        ap = self.config["appearance"]
+        lay = self.config["layout"]
+        layout_type = lay.get("type", "vertical")
         tab = QFrame()
         layout = QVBoxLayout(tab)
         
@@ -403,15 +615,15 @@ class SettingsDialog(QDialog):
         type_layout = QVBoxLayout(type_group)
         
         self.layout_vertical = QRadioButton("Vertical")
-        self.layout_vertical.setChecked(self.config.get("layout", {}).get("type", "vertical") == "vertical")
+        self.layout_vertical.setChecked(layout_type == "vertical")
         type_layout.addWidget(self.layout_vertical)
         
         self.layout_horizontal = QRadioButton("Horizontal")
-        self.layout_horizontal.setChecked(self.config.get("layout", {}).get("type", "horizontal") == "horizontal")
+        self.layout_horizontal.setChecked(layout_type == "horizontal")
         type_layout.addWidget(self.layout_horizontal)
         
         self.layout_grid = QRadioButton("Grid")
-        self.layout_grid.setChecked(self.config.get("layout", {}).get("type", "grid") == "grid")
+        self.layout_grid.setChecked(layout_type == "grid")
         type_layout.addWidget(self.layout_grid)
         
         # Grid columns (only active when grid layout is selected)
@@ -420,8 +632,8 @@ class SettingsDialog(QDialog):
         self.grid_columns = QSpinBox()
         self.grid_columns.setMinimum(1)
         self.grid_columns.setMaximum(4)
-        self.grid_columns.setValue(self.config.get("layout", {}).get("columns", 2))
-        self.grid_columns.setEnabled(self.config.get("layout", {}).get("type", "grid") == "grid")
+        self.grid_columns.setValue(lay.get("columns", 2))
+        self.grid_columns.setEnabled(layout_type == "grid")
         grid_columns_layout.addWidget(self.grid_columns)
         type_layout.addLayout(grid_columns_layout)
         
@@ -432,13 +644,13 @@ class SettingsDialog(QDialog):
         
         # Layout options
         options_group = QGroupBox("Layout Options")
-        options_layout = QFormLayout(options_group)
+        options_layout = _form(options_group)
         
         # Spacing between elements
         self.spacing_spin = QSpinBox()
         self.spacing_spin.setMinimum(0)
         self.spacing_spin.setMaximum(20)
-        self.spacing_spin.setValue(self.config.get("layout", {}).get("spacing", 5))
+        self.spacing_spin.setValue(lay.get("spacing", 5))
         options_layout.addRow("Spacing:", self.spacing_spin)
         
         # Nota: Eliminamos las opciones de scrollbar y dimensiones máximas por petición del usuario
@@ -456,38 +668,27 @@ class SettingsDialog(QDialog):
         self.component_list.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         
         # Add components in their current order
-        component_items = [
-            ("CPU", "cpu", self.config.get("layout", {}).get("component_order", {}).get("cpu", 0)),
-            ("GPU", "gpu", self.config.get("layout", {}).get("component_order", {}).get("gpu", 1)),
-            ("RAM", "ram", self.config.get("layout", {}).get("component_order", {}).get("ram", 2)),
-            ("Network", "network", self.config.get("layout", {}).get("component_order", {}).get("network", 3))
-        ]
-        component_items.sort(key=lambda x: x[2])  # Sort by current order
-        
-        for display_name, key, _ in component_items:
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.ItemDataRole.UserRole, key)  # Store the component key
-            self.component_list.addItem(item)
+        _fill_order_list(self.component_list, self._component_rows())
         
         order_layout.addWidget(self.component_list)
         layout.addWidget(order_group)
         
         # Fine-tune positioning group (X/Y offset)
         position_group = QGroupBox("Fine-tune Positioning")
-        position_layout = QFormLayout(position_group)
+        position_layout = _form(position_group)
         
         # X offset
         self.x_offset = QSpinBox()
-        self.x_offset.setMinimum(-100)
-        self.x_offset.setMaximum(100)
-        self.x_offset.setValue(self.config.get("appearance", {}).get("offset_x", 0))
+        self.x_offset.setMinimum(-10000)
+        self.x_offset.setMaximum(10000)
+        self.x_offset.setValue(ap.get("offset_x", 0))
         position_layout.addRow("X Offset:", self.x_offset)
         
         # Y offset
         self.y_offset = QSpinBox()
-        self.y_offset.setMinimum(-100)
-        self.y_offset.setMaximum(100)
-        self.y_offset.setValue(self.config.get("appearance", {}).get("offset_y", 0))
+        self.y_offset.setMinimum(-10000)
+        self.y_offset.setMaximum(10000)
+        self.y_offset.setValue(ap.get("offset_y", 0))
         position_layout.addRow("Y Offset:", self.y_offset)
         
         layout.addWidget(position_group)
@@ -495,60 +696,39 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return tab
     
+    def _component_rows(self):
+        """(display name, key) rows of the component order list, in the configured order"""
+        component_order = self.config["layout"]["component_order"]
+        component_items = sorted(_COMPONENT_ROWS, key=lambda x: component_order.get(x[1], x[2]))  # Sort by current order
+        return [(display_name, key) for display_name, key, _ in component_items]
+    
     def create_metrics_order_tab(self):
         """Create tab for ordering individual metrics within each component"""
         tab = QFrame()
         layout = QVBoxLayout(tab)
         
-        # Create a tab widget for different metric categories
+        # Create a tab widget for different metric categories, each page built on first visit
         metrics_tabs = QTabWidget()
-        
-        # CPU metrics ordering
-        cpu_tab = self.create_metrics_ordering_widget("cpu", [
-            ("CPU Usage", "cpu_usage"),
-            ("CPU Temperature", "cpu_temperature"),
-            ("CPU Frequency", "cpu_frequency"),
-            ("CPU Voltage", "cpu_voltage")
-        ])
-        metrics_tabs.addTab(cpu_tab, "CPU Metrics")
-        
-        # GPU metrics ordering
-        gpu_tab = self.create_metrics_ordering_widget("gpu", [
-            ("GPU Core Usage", "gpu_core_usage"),
-            ("GPU Core Temperature", "gpu_core_temperature"),
-            ("GPU Core Frequency", "gpu_core_frequency"),
-            ("GPU Memory Frequency", "gpu_memory_frequency"),
-            ("GPU Memory Temperature", "gpu_memory_temperature"),
-            ("GPU Hotspot Temperature", "gpu_hotspot_temperature"),
-            ("GPU VRAM usage", "gpu_vram_usage"),
-            ("GPU VRAM Memory", "gpu_vram_memory"),
-            ("GPU Fan Speed", "gpu_fan_speed")
+        self._order_built, _ = self._add_lazy_tabs(metrics_tabs, [
+            (lambda: self.create_metrics_ordering_widget("cpu"), "CPU Metrics"),
+            (lambda: self.create_metrics_ordering_widget("gpu"), "GPU Metrics"),
+            (lambda: self.create_metrics_ordering_widget("ram"), "RAM Metrics"),
+            (lambda: self.create_metrics_ordering_widget("network"), "Network Metrics"),
         ])
-        metrics_tabs.addTab(gpu_tab, "GPU Metrics")
-        
-        # RAM metrics ordering
-        ram_tab = self.create_metrics_ordering_widget("ram", [
-            ("RAM Usage Percent", "ram_percent"),
-            ("RAM Used/Total", "ram_used_total"),
-            ("RAM Available", "ram_available"),
-            ("RAM Temperature", "ram_temperature")
-        ])
-        metrics_tabs.addTab(ram_tab, "RAM Metrics")
-        
-        # Network metrics ordering
-        network_tab = self.create_metrics_ordering_widget("network", [
-            ("Upload Speed", "network_upload_speed"),
-            ("Download Speed", "network_download_speed"),
-            ("Total Sent", "network_total_sent"),
-            ("Total Received", "network_total_received")
-        ])
-        metrics_tabs.addTab(network_tab, "Network Metrics")
         
         layout.addWidget(metrics_tabs)
         layout.addStretch()
         return tab
     
-    def create_metrics_ordering_widget(self, component, metrics):
+    def _metric_rows(self, component):
+        """(display name, key) rows of a component's enabled metrics, in the configured order"""
+        disp = self.config["display"]
+        return [
+            (METRIC_DISPLAY_NAMES[key], key)
+            for key in self._sorted_metric_keys[component] if disp.get(f"show_{key}", True)
+        ]
+    
+    def create_metrics_ordering_widget(self, component):
         """Create a widget for ordering metrics of a specific component"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -560,23 +740,8 @@ class SettingsDialog(QDialog):
         metrics_list = QListWidget()
         metrics_list.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         
-        # Add metrics to the list in their current order
-        metrics_to_display = []
-        for display_name, metric_key in metrics:
-            # Get current order or use default if not set
-            order = self.config.get("layout", {}).get("metric_order", {}).get(metric_key, 999)
-            # Only include metrics that are enabled
-            if self.config["display"].get(f"show_{metric_key}", True):
-                metrics_to_display.append((display_name, metric_key, order))
-        
-        # Sort by current order
-        metrics_to_display.sort(key=lambda x: x[2])
-        
-        # Populate the list widget
-        for display_name, metric_key, _ in metrics_to_display:
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.ItemDataRole.UserRole, metric_key)  # Store the metric key
-            metrics_list.addItem(item)
+        # Add the enabled metrics to the list in their current order
+        _fill_order_list(metrics_list, self._metric_rows(component))
         
         # Store reference to list widget
         setattr(self, f"{component}_metrics_list", metrics_list)
@@ -584,51 +749,53 @@ class SettingsDialog(QDialog):
         layout.addWidget(metrics_list)
         return widget
         
-    def _on_main_component_toggled(self, state):
-        """Enable/disable detailed tabs when main component is toggled"""
-        sender = self.sender()
-        
-        if sender == self.show_cpu:
-            self.tabs_detailed.widget(0).setEnabled(state == Qt.CheckState.Checked)
-        elif sender == self.show_gpu:
-            self.tabs_detailed.widget(1).setEnabled(state == Qt.CheckState.Checked)
-        elif sender == self.show_ram:
-            self.tabs_detailed.widget(2).setEnabled(state == Qt.CheckState.Checked)
-        elif sender == self.show_network:
-            self.tabs_detailed.widget(3).setEnabled(state == Qt.CheckState.Checked)
+    def _on_main_component_toggled(self, index, checked):
+        """Enable/disable a detailed tab when its main component is toggled
+        
+        Args:
+            index: The component's page in tabs_detailed, bound when connecting
+            checked: The checkbox's new state
+        """
+        self.tabs_detailed.widget(index).setEnabled(checked)
+        # A page skipped while its component was off is built once it is enabled on screen
+        if checked and index == self.tabs_detailed.currentIndex():
+            self._build_detail_page(index)
     
     def set_button_color(self, button, color_str):
         """Set the background color of a button"""
-        color = QColor(color_str)
-        palette = button.palette()
-        palette.setColor(QPalette.ColorRole.Button, color)
-        button.setPalette(palette)
-        
         # Set text to be visible against the background
-        text_color = QColor(255, 255, 255) if color.lightness() < 128 else QColor(0, 0, 0)
-        palette.setColor(QPalette.ColorRole.ButtonText, text_color)
-        button.setPalette(palette)
+        text_color = _LIGHT_TEXT if _qcolor(color_str).lightness() < 128 else _DARK_TEXT
         
-        # Show color hex code
-        button.setText(color_str)
+        # Restyle and relabel with updates off, so the button repaints once
+        button.setUpdatesEnabled(False)
+        try:
+            button.setStyleSheet(f"QPushButton {{ background-color: {color_str}; color: {text_color}; }}")
+            
+            # Show color hex code
+            button.setText(color_str)
+        finally:
+            button.setUpdatesEnabled(True)
     
     def pick_font(self):
         """Open font dialog to pick a font"""
-        current_font = QFont(
-            self.config["appearance"]["font_family"],
-            self.config["appearance"]["font_size"]
-        )
+        ap = self.config["appearance"]
+        current_font = _qfont(ap["font_family"], ap["font_size"])
         
         font, ok = QFontDialog.getFont(current_font, self, "Select Font")
         if ok:
-            self.config["appearance"]["font_family"] = font.family()
-            self.config["appearance"]["font_size"] = font.pointSize()
-            self.font_button.setFont(font)
-            self.font_button.setText(f"{font.family()}, {font.pointSize()}pt")
+            ap["font_family"] = font.family()
+            ap["font_size"] = font.pointSize()
+            # Change font and label with updates off, so the button repaints once
+            self.font_button.setUpdatesEnabled(False)
+            try:
+                self.font_button.setFont(font)
+                self.font_button.setText(f"{font.family()}, {font.pointSize()}pt")
+            finally:
+                self.font_button.setUpdatesEnabled(True)
     
     def pick_text_color(self):
         """Open color dialog to pick text color"""
-        current_color = QColor(self.config["appearance"]["font_color"])
+        current_color = _qcolor(self.config["appearance"]["font_color"])
         color = QColorDialog.getColor(current_color, self, "Select Text Color")
         
         if color.isValid():
@@ -637,7 +804,7 @@ class SettingsDialog(QDialog):
     
     def pick_border_color(self):
         """Open color dialog to pick border color"""
-        current_color = QColor(self.config["appearance"].get("border_color", "#000000"))
+        current_color = _qcolor(self.config["appearance"].get("border_color", "#000000"))
         color = QColorDialog.getColor(current_color, self, "Select Border Color")
         
         if color.isValid():
@@ -646,211 +813,94 @@ class SettingsDialog(QDialog):
     
     def reset_defaults(self):
         """Reset all settings to default values"""
-        # Define defaults
-        defaults = {
-            "appearance": {
-                "font_family": "Consolas",
-                "font_size": 10,
-                "font_color": "#FFFFFF",
-                "border_color": "#000000",
-                "show_border": False,
-                "opacity": 0.7,
-                "refresh_rate": 1.0,
-                "position": "bottom-right",
-                "padding": 10,
-                "custom_position": [100, 100],
-                "max_width": 800,
-                "max_height": 600,
-                "offset_x": 0,
-                "offset_y": 0
-            },
-            "display": {
-                "show_cpu": True,
-                "show_gpu": True,
-                "show_ram": True,
-                "show_network": True,
-                "show_titles": True,
-                "compact_mode": False,
-                
-                # CPU detailed metrics
-                "show_cpu_usage": True,
-                "show_cpu_temperature": True,
-                "show_cpu_frequency": True,
-                "show_cpu_voltage": True,
-                
-                # GPU detailed metrics
-                "show_gpu_core_usage": True,
-                "show_gpu_core_temperature": True,
-                "show_gpu_core_frequency": True,
-                "show_gpu_memory_frequency": True,
-                "show_gpu_memory_temperature": True,
-                "show_gpu_hotspot_temperature": True,
-                "show_gpu_vram_usage": True,
-                "show_gpu_vram_memory": True,
-                "show_gpu_fan_speed": True,
-                
-                # RAM detailed metrics
-                "show_ram_percent": True,
-                "show_ram_used_total": True,
-                "show_ram_available": True,
-                "show_ram_temperature": True,
-                
-                # Network detailed metrics
-                "show_network_upload_speed": True,
-                "show_network_download_speed": True,
-                "show_network_total_sent": True,
-                "show_network_total_received": True
-            },
-            "layout": {
-                "type": "vertical",
-                "columns": 2,
-                "spacing": 5,
-                "use_scroll": True,
-                "component_order": {
-                    "cpu": 0,
-                    "gpu": 1,
-                    "ram": 2,
-                    "network": 3
-                }
-            }
-        }
-        
-        # Update config
-        self.config = copy.deepcopy(defaults)
-        
-        # Update UI to reflect defaults
-        self.reject()  # Close dialog
-        
-        # Create a new dialog with default settings
-        new_dialog = SettingsDialog(defaults, self.parent())
-        new_dialog.exec()
+        # Update config with a fresh copy of the application defaults
+        self._set_working_config(_fresh_defaults())
+        
+        # Update UI to reflect defaults; pages not built yet will be built from the new config
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_config_to_widgets(self.config)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _apply_config_to_widgets(self, config):
+        """Set the widgets of every built page to the values in config"""
+        tabs_built = self._tabs_built
+        display = config["display"]
+        
+        # Plain widget values of every tab that was built (keys the config lacks are left alone)
+        for built, bindings in zip(tabs_built, _TAB_BINDINGS):
+            if not built:
+                continue
+            for section, key, attr, _, setter in bindings:
+                if key in config[section]:
+                    setter(getattr(self, attr), config[section][key])
+        
+        # Font and color buttons
+        if tabs_built[0]:
+            ap = config["appearance"]
+            font = _qfont(ap["font_family"], ap["font_size"])
+            self.font_button.setFont(font)
+            self.font_button.setText(f"{font.family()}, {font.pointSize()}pt")
+            self.set_button_color(self.text_color_button, ap["font_color"])
+            self.set_button_color(self.border_color_button, ap.get("border_color", "#000000"))
+        
+        # Detailed metrics (only pages that were built have checkboxes)
+        for key, checkbox in self._checkbox_by_key.items():
+            checkbox.setChecked(display[key])
+        
+        # Layout type and component order
+        if tabs_built[2]:
+            layout_type = config["layout"].get("type", "vertical")
+            self.layout_vertical.setChecked(layout_type == "vertical")
+            self.layout_horizontal.setChecked(layout_type == "horizontal")
+            self.layout_grid.setChecked(layout_type == "grid")
+            _fill_order_list(self.component_list, self._component_rows())
+        
+        # Metric order of each ordering page that was built
+        if tabs_built[3]:
+            for built, component in zip(self._order_built, COMPONENT_METRIC_KEYS):
+                if built:
+                    _fill_order_list(getattr(self, f"{component}_metrics_list"), self._metric_rows(component))
     
     def get_config(self):
         """Get the current configuration from UI elements"""
-        # Update config from UI elements
-        
-        # Appearance tab
-        self.config["appearance"]["opacity"] = self.opacity_slider.value() / 100.0
-        self.config["appearance"]["padding"] = self.padding_spin.value()
-        
-        # Border settings
-        self.config["appearance"]["show_border"] = self.show_border_checkbox.isChecked()
-        
-        # Position offset values
-        self.config["appearance"]["offset_x"] = self.offset_x_spin.value()
-        self.config["appearance"]["offset_y"] = self.offset_y_spin.value()
-        
-        # Position
-        position_index = self.position_combo.currentIndex()
-        positions = ["top-left", "top-right", "bottom-left", "bottom-right", "center", "custom"]
-        self.config["appearance"]["position"] = positions[position_index]
-        
-        # Monitor selection
-        self.config["appearance"]["monitor_index"] = self.monitor_combo.currentIndex()
+        # Update config from UI elements. Tabs that were never opened have no
+        # widgets; their settings are still the ones in self.config.
+        tabs_built = self._tabs_built
+        config = self.config
+        display = config["display"]
+        layout = config["layout"]
+        
+        # Plain widget values of every tab that was built
+        for built, bindings in zip(tabs_built, _TAB_BINDINGS):
+            if not built:
+                continue
+            for section, key, attr, getter, _ in bindings:
+                config[section][key] = getter(getattr(self, attr))
+        
+        # Detailed metrics (only pages that were built have checkboxes)
+        for key, checkbox in self._checkbox_by_key.items():
+            display[key] = checkbox.isChecked()
         
-        # Refresh rate
-        refresh_index = self.refresh_combo.currentIndex()
-        refresh_rates = [0.5, 1.0, 2.0, 5.0]
-        self.config["appearance"]["refresh_rate"] = refresh_rates[refresh_index]
-        
-        # Display tab - Main components
-        self.config["display"]["show_cpu"] = self.show_cpu.isChecked()
-        self.config["display"]["show_gpu"] = self.show_gpu.isChecked()
-        self.config["display"]["show_ram"] = self.show_ram.isChecked()
-        self.config["display"]["show_network"] = self.show_network.isChecked()
-        self.config["display"]["show_titles"] = self.show_titles.isChecked()
-        self.config["display"]["compact_mode"] = self.compact_mode.isChecked()
-        
-        # CPU detailed metrics
-        self.config["display"]["show_cpu_usage"] = self.show_cpu_usage.isChecked()
-        self.config["display"]["show_cpu_temperature"] = self.show_cpu_temperature.isChecked()
-        self.config["display"]["show_cpu_frequency"] = self.show_cpu_frequency.isChecked()
-        self.config["display"]["show_cpu_voltage"] = self.show_cpu_voltage.isChecked()
-        
-        # GPU detailed metrics
-        self.config["display"]["show_gpu_core_usage"] = self.show_gpu_core_usage.isChecked()
-        self.config["display"]["show_gpu_core_temperature"] = self.show_gpu_core_temperature.isChecked()
-        self.config["display"]["show_gpu_core_frequency"] = self.show_gpu_core_frequency.isChecked()
-        self.config["display"]["show_gpu_memory_frequency"] = self.show_gpu_memory_frequency.isChecked()
-        self.config["display"]["show_gpu_memory_temperature"] = self.show_gpu_memory_temperature.isChecked()
-        self.config["display"]["show_gpu_hotspot_temperature"] = self.show_gpu_hotspot_temperature.isChecked()
-        self.config["display"]["show_gpu_vram_usage"] = self.show_gpu_vram_usage.isChecked()
-        self.config["display"]["show_gpu_vram_memory"] = self.show_gpu_vram_memory.isChecked()
-        self.config["display"]["show_gpu_fan_speed"] = self.show_gpu_fan_speed.isChecked()
-        
-        # RAM detailed metrics
-        self.config["display"]["show_ram_percent"] = self.show_ram_percent.isChecked()
-        self.config["display"]["show_ram_used_total"] = self.show_ram_used_total.isChecked()
-        self.config["display"]["show_ram_available"] = self.show_ram_available.isChecked()
-        self.config["display"]["show_ram_temperature"] = self.show_ram_temperature.isChecked()
-        
-        # Network detailed metrics
-        self.config["display"]["show_network_upload_speed"] = self.show_network_upload_speed.isChecked()
-        self.config["display"]["show_network_download_speed"] = self.show_network_download_speed.isChecked()
-        self.config["display"]["show_network_total_sent"] = self.show_network_total_sent.isChecked()
-        self.config["display"]["show_network_total_received"] = self.show_network_total_received.isChecked()
-        
-        # Layout settings
-        if "layout" not in self.config:
-            self.config["layout"] = {}
-            
         # Layout type
-        if self.layout_vertical.isChecked():
-            self.config["layout"]["type"] = "vertical"
-        elif self.layout_horizontal.isChecked():
-            self.config["layout"]["type"] = "horizontal"
-        elif self.layout_grid.isChecked():
-            self.config["layout"]["type"] = "grid"
-            
-        # Grid columns
-        self.config["layout"]["columns"] = self.grid_columns.value()
-        
-        # Spacing
-        self.config["layout"]["spacing"] = self.spacing_spin.value()
-        
-        # Always use auto-size and no scrollbar (eliminamos opciones de usuario)
-        self.config["layout"]["use_scroll"] = False
-        
-        # Component order
-        if "component_order" not in self.config["layout"]:
-            self.config["layout"]["component_order"] = {}
-            
-        # Get order from list widget
-        for i in range(self.component_list.count()):
-            item = self.component_list.item(i)
-            component_key = item.data(Qt.ItemDataRole.UserRole)
-            self.config["layout"]["component_order"][component_key] = i
-        
-        # Individual metrics order
-        if "metric_order" not in self.config["layout"]:
-            self.config["layout"]["metric_order"] = {}
-        
-        # Save order for CPU metrics
-        for i in range(self.cpu_metrics_list.count()):
-            item = self.cpu_metrics_list.item(i)
-            metric_key = item.data(Qt.ItemDataRole.UserRole)
-            self.config["layout"]["metric_order"][metric_key] = i
-        
-        # Save order for GPU metrics
-        for i in range(self.gpu_metrics_list.count()):
-            item = self.gpu_metrics_list.item(i)
-            metric_key = item.data(Qt.ItemDataRole.UserRole)
-            self.config["layout"]["metric_order"][metric_key] = i
-        
-        # Save order for RAM metrics
-        for i in range(self.ram_metrics_list.count()):
-            item = self.ram_metrics_list.item(i)
-            metric_key = item.data(Qt.ItemDataRole.UserRole)
-            self.config["layout"]["metric_order"][metric_key] = i
-        
-        # Save order for Network metrics
-        for i in range(self.network_metrics_list.count()):
-            item = self.network_metrics_list.item(i)
-            metric_key = item.data(Qt.ItemDataRole.UserRole)
-            self.config["layout"]["metric_order"][metric_key] = i
-        
-        # Fine-tune positioning (X/Y offset)
-        self.config["appearance"]["offset_x"] = self.x_offset.value()
-        self.config["appearance"]["offset_y"] = self.y_offset.value()
-        
-        return self.config
+        if tabs_built[2]:
+            if self.layout_vertical.isChecked():
+                layout["type"] = "vertical"
+            elif self.layout_horizontal.isChecked():
+                layout["type"] = "horizontal"
+            elif self.layout_grid.isChecked():
+                layout["type"] = "grid"
+        
+        # Component order, from the list widget
+        if tabs_built[2]:
+            _collect_order(self.component_list, layout["component_order"])
+        
+        # Save the order of each component's metrics whose ordering page was opened
+        if tabs_built[3]:
+            metric_order = layout["metric_order"]
+            for built, component in zip(self._order_built, COMPONENT_METRIC_KEYS):
+                if built:
+                    _collect_order(getattr(self, f"{component}_metrics_list"), metric_order)
+        
+        return config
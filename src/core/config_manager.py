@@ -6,6 +6,7 @@ This module handles loading, saving, and managing application configuration.
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -30,7 +31,7 @@ DEFAULT_CONFIG = {
         "type": "vertical",  # "vertical", "horizontal", or "grid"
         "columns": 2,
         "spacing": 5,
-        "use_scroll": True,
+        "use_scroll": False,  # Always auto-size, never a scrollbar
         # Component order (lower values appear first)
         "component_order": {
             "cpu": 1,
@@ -103,6 +104,13 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Serialized once; parsing it back yields an independent deep copy of the defaults
+_DEFAULT_JSON = json.dumps(DEFAULT_CONFIG)
+
+def _fresh_defaults():
+    """Return a deep copy of DEFAULT_CONFIG that callers may mutate freely"""
+    return json.loads(_DEFAULT_JSON)
+
 class ConfigManager:
     """Manages application configuration loading and saving"""
     
@@ -118,6 +126,12 @@ class ConfigManager:
         else:
             self.config_path = config_path
         
+        # Single writer thread: saves leave the GUI thread without blocking it on
+        # disk I/O, and run in the order they were requested
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-writer")
+        # Last JSON handed to the writer, so saving an unchanged config doesn't touch the disk
+        self._last_written = None
+        
         self.config = self.load_config()
     
     def load_config(self):
@@ -132,37 +146,59 @@ class ConfigManager:
                 with open(self.config_path, 'r') as f:
                     config = json.load(f)
                 # Ensure all default keys exist (for compatibility with older configs)
-                for section in DEFAULT_CONFIG:
-                    if section not in config:
-                        config[section] = DEFAULT_CONFIG[section]
-                    else:
-                        for key in DEFAULT_CONFIG[section]:
-                            if key not in config[section]:
-                                config[section][key] = DEFAULT_CONFIG[section][key]
+                defaults = _fresh_defaults()
+                config.update({
+                    section: {**section_defaults, **config.get(section, {})}
+                    for section, section_defaults in defaults.items()
+                })
+                # The layout orders are dicts themselves: backfill metrics added since the file was written
+                layout = config["layout"]
+                for key in ("component_order", "metric_order"):
+                    layout[key] = {**defaults["layout"][key], **layout[key]}
                 return config
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
-                return DEFAULT_CONFIG.copy()
+                return _fresh_defaults()
         else:
             # Save default config
             self.save_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG.copy()
+            return _fresh_defaults()
     
-    def save_config(self, config=None):
+    def save_config(self, config=None, wait=True):
         """
         Save configuration to file.
         
         Args:
             config: Configuration to save. If None, uses the current configuration.
+            wait: If False, return once the write is queued instead of when it is done.
         """
         if config is None:
             config = self.config
         
+        try:
+            # Serialize here, so later changes to the dict can't leak into a queued write
+            data = json.dumps(config, indent=4)
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return
+        
+        if data == self._last_written:
+            return
+        self._last_written = data
+        
+        future = self._writer.submit(self._write_file, data)
+        if wait:
+            future.result()
+    
+    def _write_file(self, data):
+        """Write serialized configuration to the config file (runs on the writer thread)"""
         try:
             with open(self.config_path, 'w') as f:
-                json.dump(config, f, indent=4)
+                f.write(data)
         except Exception as e:
             print(f"Error saving config: {e}")
+            # Not on disk after all: let the next save retry
+            self._last_written = None
     
     def get_config(self):
         """
@@ -181,4 +217,4 @@ class ConfigManager:
             config: New configuration to use
         """
         self.config = config
-        self.save_config()
+        self.save_config(wait=False)
@@ -11,23 +11,27 @@ from PyQt6.QtCore import QObject, pyqtSignal
 class MetricsWorker(QObject):
     """Worker class for collecting hardware metrics in a background thread"""
     
-    # Signal to emit when metrics are collected
-    metrics_ready = pyqtSignal(dict)
+    # Signal to emit when metrics are collected: (raw metrics, formatted metrics)
+    metrics_ready = pyqtSignal(dict, dict)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, hardware_monitor):
+    def __init__(self, hardware_monitor, formatters=()):
         """
         Initialize the metrics worker.
         
         Args:
             hardware_monitor: The hardware monitor instance to collect metrics from
+            formatters: (category, format function) pairs, run in the worker thread
+                        on each category present in the collected metrics
         """
         super().__init__()
         self.hardware_monitor = hardware_monitor
+        self.formatters = formatters
         self.running = False
         self.thread = None
         self.interval = 1.0  # Default update interval in seconds
-        self.last_update_time = 0  # Track last update time
+        self._stop_event = threading.Event()  # Set by stop() to wake and end the loop
+        self.debug = False  # Print per-collection timing diagnostics
     
     def start(self, interval=1.0):
         """
@@ -39,50 +43,47 @@ class MetricsWorker(QObject):
         print(f"MetricsWorker starting with interval: {interval} seconds")
         self.interval = float(interval)  # Ensure interval is float
         self.running = True
-        self.last_update_time = 0  # Reset timer
-        self.thread = threading.Thread(target=self._run, daemon=True)
+        # Fresh event per thread, so a previous thread that outlived stop()'s join
+        # timeout still sees its own stop request
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(self._stop_event,), daemon=True)
         self.thread.start()
     
     def stop(self):
         """Stop the worker thread"""
         self.running = False
+        self._stop_event.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=1.0)
     
-    def _run(self):
-        """Main worker loop - runs in a separate thread"""
-        while self.running:
-            # First, check the current time
-            current_time = time.time()
+    def _run(self, stop_event):
+        """Main worker loop - runs in a separate thread
+        
+        Args:
+            stop_event: Event that ends the loop when set
+        """
+        while not stop_event.is_set():
+            # Record start time, so collection time counts towards the interval
+            start_time = time.monotonic()
             
-            # Check if we need to collect metrics now
-            if current_time - self.last_update_time >= self.interval:
-                try:
-                    # Record start time for diagnostics
-                    start_time = time.time()
-                    
-                    # Collect metrics
-                    metrics = self.hardware_monitor.get_all_metrics()
-                    
-                    # Calculate collection time for diagnostics
-                    collection_time = time.time() - start_time
+            try:
+                # Collect metrics
+                metrics = self.hardware_monitor.get_all_metrics()
+                
+                # Collection time diagnostics, off by default: printing flushes stdout every tick
+                if self.debug:
+                    collection_time = time.monotonic() - start_time
                     print(f"Metrics collection took {collection_time:.3f} seconds with interval {self.interval}s")
-                    
-                    # Emit signal with metrics
-                    self.metrics_ready.emit(metrics)
-                    
-                    # Update the timestamp for when we last collected metrics
-                    # We use current_time (before collection) to maintain proper timing
-                    self.last_update_time = current_time
-                except Exception as e:
-                    # Emit error signal
-                    self.error_occurred.emit(str(e))
-            
-            # Calculate how long to sleep until next update
-            time_until_next_update = max(0.01, self.interval - (time.time() - self.last_update_time))
-            
-            # Cap the sleep time to avoid excessively long sleeps if something goes wrong
-            sleep_time = min(0.1, time_until_next_update)  # Sleep max 100ms at a time for responsiveness
+                
+                # Format here, so the GUI thread only has to set label texts
+                formatted = {key: formatter(metrics[key]) for key, formatter in self.formatters if key in metrics}
+                
+                # Emit signal with metrics
+                self.metrics_ready.emit(metrics, formatted)
+            except Exception as e:
+                # Emit error signal
+                self.error_occurred.emit(str(e))
             
-            # Short sleep to prevent CPU spinning while maintaining timing accuracy
-            time.sleep(sleep_time)
+            # Sleep for the rest of the interval; stop() wakes us right away
+            if stop_event.wait(max(0.0, self.interval - (time.monotonic() - start_time))):
+                return
@@ -5,13 +5,15 @@ This module contains the main window class that coordinates all UI components.
 """
 
 from PyQt6.QtWidgets import QMainWindow, QWidget, QSizePolicy, QVBoxLayout
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSlot
 from PyQt6.QtGui import QColor
 
 from src.ui.metrics_display import MetricsDisplay
 from src.ui.system_tray import SystemTrayManager
 from src.ui.position_manager import PositionManager
 
+_ALIGN_TOP = Qt.AlignmentFlag.AlignTop
+
 class MainWindow(QMainWindow):
     """Main window class for the hardware monitor widget"""
     
@@ -29,6 +31,8 @@ class MainWindow(QMainWindow):
         
         self.config_manager = config_manager
         self.config = config_manager.get_config()
+        # The appearance section, read on every resize and reposition; rebound with self.config
+        self._appearance = self.config["appearance"]
         self.metrics_worker = metrics_worker
         self.console_handler = console_handler
         self.settings_dialog_class = settings_dialog_class
@@ -60,6 +64,13 @@ class MainWindow(QMainWindow):
         self.draggable = True
         self.drag_position = None
         
+        # Drag moves arrive far more often than the position needs recording; keep
+        # only the latest one and commit it to the config at most once per frame
+        self._pending_pos = None
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.timeout.connect(self._commit_pos)
+        
         # Start metrics worker
         self.start_metrics_worker()
         
@@ -87,8 +98,8 @@ class MainWindow(QMainWindow):
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         
         # Set minimum and maximum sizes based on config
-        max_width = self.config["appearance"]["max_width"]
-        max_height = self.config["appearance"]["max_height"]
+        max_width = self._appearance["max_width"]
+        max_height = self._appearance["max_height"]
         self.setMinimumSize(max_width, 100)  # Ensure minimum width matches config
         self.setMaximumSize(16777215, 16777215)  # Very large maximum size (QWIDGETSIZE_MAX)
         
@@ -110,51 +121,37 @@ class MainWindow(QMainWindow):
         
         # Create layout for central widget with minimal margins to match original behavior
         self.main_layout = QVBoxLayout(self.central_widget)
-        padding = self.config["appearance"]["padding"]
+        padding = self._appearance["padding"]
         self.main_layout.setContentsMargins(padding, padding, padding, padding)
         self.main_layout.setSpacing(0)
-        self.main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.main_layout.setAlignment(_ALIGN_TOP)
         
         # Create metrics display
         self.metrics_display = MetricsDisplay(self.config)
         self.main_layout.addWidget(self.metrics_display)
         
         # Set opacity
-        self.setWindowOpacity(self.config["appearance"]["opacity"])
+        self.setWindowOpacity(self._appearance["opacity"])
     
-    def on_metrics_ready(self, metrics):
+    @pyqtSlot(dict, dict)
+    def on_metrics_ready(self, metrics, formatted_metrics):
         """
         Handle metrics from worker thread.
         
         Args:
             metrics: Dictionary of metrics from the worker
+            formatted_metrics: The metrics' display strings, formatted by the worker
         """
         # Store last metrics
         self.last_metrics = metrics
         
-        # Update metrics display using formatter
-        from src.ui.metrics_formatter import MetricsFormatter
-        
-        formatted_metrics = {}
-        
-        if "cpu" in metrics:
-            formatted_metrics["cpu"] = MetricsFormatter.format_cpu_metrics(metrics["cpu"])
-        
-        if "gpu" in metrics:
-            formatted_metrics["gpu"] = MetricsFormatter.format_gpu_metrics(metrics["gpu"])
-        
-        if "ram" in metrics:
-            formatted_metrics["ram"] = MetricsFormatter.format_ram_metrics(metrics["ram"])
-        
-        if "network" in metrics:
-            formatted_metrics["network"] = MetricsFormatter.format_network_metrics(metrics["network"])
-        
         # Update metrics display
         self.metrics_display.update_metrics(formatted_metrics)
         
         # Update tray icon
         self.system_tray.update_icon(metrics)
     
+    @pyqtSlot(str)
     def on_metrics_error(self, error_message):
         """
         Handle errors from worker thread.
@@ -172,7 +169,7 @@ class MainWindow(QMainWindow):
             restart: Whether to restart an existing worker
         """
         # Ensure the interval is correct (between 0.1 and 5 seconds)
-        interval = float(self.config["appearance"]["refresh_rate"])
+        interval = float(self._appearance["refresh_rate"])
         interval = max(0.1, min(interval, 5.0))
             
         # Stop the worker if it's already running and we're restarting
@@ -184,20 +181,17 @@ class MainWindow(QMainWindow):
     
     def apply_position(self):
         """Apply the configured position to the widget"""
-        # Make sure the content is properly sized
-        self.metrics_display.updateGeometry()
-        
-        # First, let Qt determine the proper size based on content
-        self.adjustSize()
+        # Size the widget from the display's size hint in one resize, rather than an
+        # adjustSize() layout pass followed by a second resize
+        hint = self.metrics_display.sizeHint()
         
-        # Make sure the widget is wide enough to display all content
-        max_width = self.config["appearance"]["max_width"]
-        current_width = max(self.width(), max_width)
+        # Make sure the widget is wide enough to display all content, plus the
+        # layout's padding on both sides (which adjustSize() used to include)
+        padding = self._appearance["padding"]
+        current_width = max(self._appearance["max_width"], hint.width() + 2 * padding)
         
-        # Use content height, but ensure it fits within max_height
-        max_height = self.config["appearance"]["max_height"]
-        calculated_height = self.metrics_display.sizeHint().height() + 20
-        current_height = min(max_height, calculated_height)
+        # The display's size hint is max_height tall, so this is max_height
+        current_height = min(self._appearance["max_height"], hint.height() + 20)
         
         # Resize the widget
         self.resize(current_width, current_height)
@@ -216,18 +210,22 @@ class MainWindow(QMainWindow):
             new_config: New configuration dictionary
         """
         self.config = new_config
+        self._appearance = new_config["appearance"]
         self.config_manager.update_config(new_config)
         
         # Update opacity
-        self.setWindowOpacity(self.config["appearance"]["opacity"])
+        self.setWindowOpacity(self._appearance["opacity"])
         
         # Update position manager
-        self.position_manager = PositionManager(self.config)
+        self.position_manager.update_config(self.config)
         
-        # Update metrics display
-        self.metrics_display.config = self.config
-        self.metrics_display.setup_metric_sections()
-        self.metrics_display.update_style()
+        # Replace the metrics display with one built for the new config; building a
+        # fresh widget tree is cheaper than tearing down and refilling the old one
+        old_display = self.metrics_display
+        self.metrics_display = MetricsDisplay(self.config)
+        self.main_layout.replaceWidget(old_display, self.metrics_display)
+        old_display.setParent(None)
+        old_display.deleteLater()
         
         # Apply new position
         self.apply_position()
@@ -235,6 +233,7 @@ class MainWindow(QMainWindow):
         # Restart metrics worker with new refresh rate
         self.start_metrics_worker(restart=True)
     
+    @pyqtSlot()
     def toggle_visibility(self):
         """Toggle widget visibility"""
         if self.isVisible():
@@ -245,19 +244,24 @@ class MainWindow(QMainWindow):
             self.apply_position()
             self.system_tray.update_toggle_text(True)
     
+    @pyqtSlot()
     def open_settings(self):
         """Open the settings dialog"""
         dialog = self.settings_dialog_class(self.config, self)
         if dialog.exec():
-            # If dialog was accepted, update and save config
+            # If dialog was accepted, update and save config (unless nothing changed,
+            # in which case there is nothing to write or re-apply)
             new_config = dialog.get_config()
-            self.update_config(new_config)
+            if new_config != self.config:
+                self.update_config(new_config)
     
+    @pyqtSlot()
     def toggle_console(self):
         """Toggle console window visibility"""
         is_visible = self.console_handler.toggle_console()
         self.system_tray.update_console_text(is_visible)
     
+    @pyqtSlot()
     def exit_app(self):
         """Exit the application"""
         # Stop the metrics worker thread
@@ -282,7 +286,7 @@ class MainWindow(QMainWindow):
             event.accept()
             
             # Record that this is now a custom position
-            self.config["appearance"]["position"] = "custom"
+            self._appearance["position"] = "custom"
     
     def mouseMoveEvent(self, event):
         """Handle mouse move events for dragging"""
@@ -290,18 +294,29 @@ class MainWindow(QMainWindow):
             new_pos = event.globalPosition().toPoint() - self.drag_position
             self.move(new_pos)
             
-            # Update custom position in config
-            self.position_manager.update_custom_position(new_pos)
+            # Update custom position in config (throttled, see _commit_pos)
+            self._pending_pos = new_pos
+            if not self._pos_timer.isActive():
+                self._pos_timer.start(16)
             event.accept()
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release events for dragging"""
         if event.button() == Qt.MouseButton.LeftButton and self.draggable:
             self.drag_position = None
-            # Save the final position
+            # Record the last drag position still waiting on the timer, then save it
+            if self._pos_timer.isActive():
+                self._pos_timer.stop()
+                self._commit_pos()
             self.config_manager.save_config()
             event.accept()
     
+    def _commit_pos(self):
+        """Store the latest drag position as the custom position"""
+        if self._pending_pos is not None:
+            self.position_manager.update_custom_position(self._pending_pos)
+            self._pending_pos = None
+    
     def mouseDoubleClickEvent(self, event):
         """Handle double click events"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -316,7 +331,7 @@ class MainWindow(QMainWindow):
             QSize: The suggested size
         """
         # Use the configured max width and let height adjust to content
-        max_width = self.config["appearance"]["max_width"]
+        max_width = self._appearance["max_width"]
         
         if hasattr(self, 'metrics_display'):
             # Get the display's size hint
@@ -0,0 +1,119 @@
+"""
+Metrics Canvas Module
+
+This module contains the widget that paints the metric lines of one component.
+"""
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPainter, QFont, QColor
+
+# Alignment of every painted line, as the int flags QPainter.drawText takes
+_TEXT_FLAGS = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter).value
+
+class MetricsCanvas(QWidget):
+    """Widget painting a component's title and metric lines in a single paintEvent"""
+    
+    def __init__(self, title=None):
+        """
+        Initialize the metrics canvas.
+        
+        Args:
+            title: Title painted in bold above the metrics, or None for no title
+        """
+        super().__init__()
+        
+        self._title = title
+        self._lines = []
+        
+        # Look of the lines, set by set_style
+        self._font = QFont()
+        self._title_font = QFont()
+        self._color = QColor("#FFFFFF")
+        self._line_width = 0
+        self._line_height = 0
+        self._line_spacing = 0
+        
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+    
+    def set_style(self, font, color, line_width, line_height, line_spacing):
+        """
+        Set the look of the painted lines.
+        
+        Args:
+            font: Font of the metric lines; the title uses a bold copy
+            color: Text color (QColor)
+            line_width: Minimum width of a line in pixels
+            line_height: Height of a line in pixels
+            line_spacing: Space between lines in pixels
+        """
+        self._font = font
+        self._title_font = QFont(font)
+        self._title_font.setBold(True)
+        self._color = color
+        self._line_width = line_width
+        self._line_height = line_height
+        self._line_spacing = line_spacing
+        self.updateGeometry()
+        self.update()
+    
+    def set_lines(self, lines):
+        """
+        Set the metric lines to paint, repainting only if they changed.
+        
+        Args:
+            lines: List of metric strings in display order
+        """
+        if lines == self._lines:
+            return
+        resized = len(lines) != len(self._lines)
+        self._lines = lines
+        if resized:
+            # The layout gives the canvas a new height
+            self.updateGeometry()
+        self.update()
+    
+    def sizeHint(self):
+        """
+        Get the size needed to paint the title and every line.
+        
+        Returns:
+            QSize: The suggested size
+        """
+        rows = len(self._lines) + (self._title is not None)
+        height = rows * self._line_height + max(rows - 1, 0) * self._line_spacing
+        return QSize(self._line_width, height)
+    
+    def minimumSizeHint(self):
+        """
+        Get the minimum size, which is the full size: lines are never clipped vertically.
+        
+        Returns:
+            QSize: The minimum size
+        """
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        """
+        Paint the title and metric lines.
+        
+        Args:
+            event: Paint event
+        """
+        painter = QPainter(self)
+        painter.setPen(self._color)
+        width = self.width()
+        height = self._line_height
+        step = height + self._line_spacing
+        y = 0
+        
+        if self._title is not None:
+            painter.setFont(self._title_font)
+            painter.drawText(0, y, width, height, _TEXT_FLAGS, self._title)
+            y += step
+        
+        painter.setFont(self._font)
+        for line in self._lines:
+            painter.drawText(0, y, width, height, _TEXT_FLAGS, line)
+            y += step
+        painter.end()
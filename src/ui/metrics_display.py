@@ -4,11 +4,20 @@ Metrics Display Module
 This module contains the widget for displaying hardware metrics.
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
                             QSizePolicy, QGridLayout)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QFont, QColor
 
+from src.ui.metrics_canvas import MetricsCanvas
+
+# Redraws per second allowed when appearance.max_redraw_hz is not set; 0 means no limit.
+# Above the fastest refresh rate (0.5 s), so it only caps bursts of metrics arriving faster
+DEFAULT_MAX_REDRAW_HZ = 4
+
+# Space between the lines of a section, in pixels
+_LINE_SPACING = 2
+
 class MetricsDisplay(QWidget):
     """Widget responsible for displaying formatted hardware metrics"""
     
@@ -22,15 +31,29 @@ class MetricsDisplay(QWidget):
         super().__init__()
         
         self.config = config
+        self.setObjectName("metricsRoot")  # Selector of the root stylesheet
+        
+        # Shown metric keys of each component in display order, worked out from the
+        # config on the component's first update
+        self._order_cache = {}
+        # (metric key, text) pairs each component was last drawn from
+        self._last_sig = {}
+        
+        # Section container and canvas of each shown component
+        self._component_containers = {}
+        self._canvases = {}
+        
+        # Font, color and stylesheets shared by all sections, rebuilt only when the appearance
+        # settings they come from change (see _refresh_styles)
+        self._style_key = None
+        self._applied_style_key = None
         
-        # Dictionaries to store label references
-        self.component_titles = {}
-        self.component_labels = {
-            "cpu": [], 
-            "gpu": [], 
-            "ram": [], 
-            "network": []
-        }
+        # Redraw rate limit: metrics arriving before the interval since the last
+        # redraw has passed are held (latest only) and drawn when it ends
+        self._pending_metrics = None
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._flush_pending_metrics)
         
         # Set sizing policies for proper rendering - use MinimumExpanding to ensure content gets full space
         self.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
@@ -87,94 +110,38 @@ class MetricsDisplay(QWidget):
     
     def setup_metric_sections(self):
         """Create sections for each hardware component using flexible layout"""
-        # Clear existing widgets if any
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # Also clear sublayouts
-                while item.layout().count():
-                    subitem = item.layout().takeAt(0)
-                    if subitem.widget():
-                        subitem.widget().deleteLater()
-        
-        # Font and color setup
-        font = QFont(
-            self.config["appearance"]["font_family"],
-            self.config["appearance"]["font_size"]
-        )
-        color = QColor(self.config["appearance"]["font_color"])
+        # Font and color setup, shared by every section below
+        self._refresh_styles()
+        
+        display = self.config["display"]
+        layout_cfg = self.config["layout"]
+        is_grid = layout_cfg["type"] == "grid"
         
         # Prepare components in order of preference
         components = []
         component_keys = ["cpu", "gpu", "ram", "network"]
         
         # Add components that are enabled
-        for key in component_keys:
-            if self.config["display"][f"show_{key}"]:
+        component_order = layout_cfg.get("component_order", {})
+        for index, key in enumerate(component_keys):
+            if display[f"show_{key}"]:
                 # Use component order from config, with fallback values
-                order = self.config["layout"].get("component_order", {}).get(key, component_keys.index(key))
-                components.append((key, order))
+                components.append((key, component_order.get(key, index)))
         
         # Sort components by their configured order
         components.sort(key=lambda x: x[1])
         
         # Grid layout positioning helpers
         grid_row, grid_col = 0, 0
-        num_columns = self.config["layout"].get("columns", 2)
+        num_columns = layout_cfg.get("columns", 2)
         
-        # Create sections for each component
+        # Create a section for each component
         for component_name, _ in components:
-            # Create container for this component with proper sizing
-            component_container = QWidget()
-            component_container.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Preferred)
-            component_layout = QVBoxLayout(component_container)
-            component_layout.setContentsMargins(5, 5, 5, 5)
-            component_layout.setSpacing(2)
-            
-            # Add title if enabled
-            if self.config["display"]["show_titles"]:
-                title_text = component_name.upper()
-                title_label = QLabel(title_text)
-                title_font = QFont(font)
-                title_font.setBold(True)
-                title_label.setFont(title_font)
-                title_label.setStyleSheet(f"color: {color.name()}; font-weight: bold;")
-                title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-                title_label.setMinimumWidth(self.config["appearance"]["max_width"] - 20)
-                component_layout.addWidget(title_label)
-                self.component_titles[component_name] = title_label
-            
-            # Create placeholder for the metrics
-            # We'll determine the actual number of metrics when we update them
-            max_placeholders = 10  # Maximum number of metrics per component
-            labels = []
-            for i in range(max_placeholders):
-                label = QLabel("")
-                label.setFont(font)
-                label.setStyleSheet(f"color: {color.name()};")
-                label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-                label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-                label.setMinimumWidth(self.config["appearance"]["max_width"] - 20)
-                label.setMinimumHeight(self.config["appearance"]["font_size"] + 10)  # Ensure height based on font size
-                label.setWordWrap(False)  # Prevent text wrapping
-                label.setVisible(False)  # Hidden by default until populated
-                component_layout.addWidget(label)
-                labels.append(label)
-            
-            # Store labels in the appropriate dictionary
-            self.component_labels[component_name] = labels
-            
-            # Apply styles to component container - add border support
-            if self.config["appearance"].get("show_border", False):
-                border_color = self.config["appearance"].get("border_color", "#000000")
-                component_container.setStyleSheet(f"background-color: transparent; border: 2px solid {border_color}; min-width: {self.config['appearance']['max_width']-10}px;")
-            else:
-                component_container.setStyleSheet(f"background-color: transparent; border: none; min-width: {self.config['appearance']['max_width']-10}px;")
+            component_container = self._create_component_section(component_name)
+            self._component_containers[component_name] = component_container
             
             # Add the component container to the layout based on type
-            if self.config["layout"]["type"] == "grid":
+            if is_grid:
                 self.content_layout.addWidget(component_container, grid_row, grid_col)
                 grid_col += 1
                 if grid_col >= num_columns:
@@ -184,53 +151,111 @@ class MetricsDisplay(QWidget):
                 self.content_layout.addWidget(component_container)
                 
         # Add a stretch at the end if not using grid layout
-        if self.config["layout"]["type"] != "grid":
+        if not is_grid:
             self.content_layout.addStretch()
     
+    def _create_component_section(self, component_name):
+        """
+        Create the container with the metrics canvas of one component.
+        
+        Args:
+            component_name: Name of the component (cpu, gpu, ram, network)
+            
+        Returns:
+            QWidget: The component's container
+        """
+        # Create container for this component with proper sizing
+        component_container = QWidget()
+        component_container.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Preferred)
+        component_layout = QVBoxLayout(component_container)
+        component_layout.setContentsMargins(5, 5, 5, 5)
+        component_layout.setSpacing(_LINE_SPACING)
+        
+        # One widget paints the title (if enabled) and all metric lines
+        title_text = component_name.upper() if self.config["display"]["show_titles"] else None
+        canvas = MetricsCanvas(title_text)
+        canvas.set_style(self._font, self._color, self._line_width, self._line_height, _LINE_SPACING)
+        component_layout.addWidget(canvas)
+        self._canvases[component_name] = canvas
+        
+        # Apply styles to component container - add border support
+        component_container.setStyleSheet(self._container_css)
+        return component_container
+    
+    def _refresh_styles(self):
+        """Rebuild the shared font, color and stylesheets if the appearance settings they use changed"""
+        ap = self.config["appearance"]
+        show_border = ap.get("show_border", False)
+        border_color = ap.get("border_color", "#000000")
+        key = (ap["font_family"], ap["font_size"], ap["font_color"], show_border, border_color, ap["max_width"])
+        if key == self._style_key:
+            return
+        self._style_key = key
+        
+        self._font = QFont(ap["font_family"], ap["font_size"])
+        self._color = QColor(ap["font_color"])
+        
+        # Line sizes
+        self._line_width = ap["max_width"] - 20
+        self._line_height = ap["font_size"] + 10  # Ensure height based on font size
+        
+        # Border if enabled
+        border_style = f"border: 2px solid {border_color};" if show_border else "border: none;"
+        self._container_css = f"background-color: transparent; {border_style} min-width: {ap['max_width'] - 10}px;"
+        self._widget_css = f"#metricsRoot {{ background-color: transparent; {border_style} }}"
+    
     def update_style(self):
         """Update the widget style based on configuration"""
-        # Apply border if enabled
-        if self.config["appearance"].get("show_border", False):
-            border_color = self.config["appearance"]["border_color"]
-            border_style = f"border: 2px solid {border_color};"
-        else:
-            border_style = "border: none;"
-            
+        # Nothing to do if the sections were already styled from these settings
+        self._refresh_styles()
+        if self._applied_style_key == self._style_key:
+            return
+        self._applied_style_key = self._style_key
+        
         # Apply styles to the widget
-        self.setStyleSheet(f"""
-            background-color: transparent;
-            {border_style}
-        """)
-        
-        # Update font for labels
-        font = QFont(
-            self.config["appearance"]["font_family"],
-            self.config["appearance"]["font_size"]
-        )
+        self.setStyleSheet(self._widget_css)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
         
-        color = QColor(self.config["appearance"]["font_color"])
-        
-        # Update component titles and labels
-        for component_name, title_label in self.component_titles.items():
-            if title_label:
-                title_font = QFont(font)
-                title_font.setBold(True)
-                title_label.setFont(title_font)
-                title_label.setStyleSheet(f"color: {color.name()}; font-weight: bold;")
-        
-        # Update component labels
-        for component_name, labels in self.component_labels.items():
-            for label in labels:
-                label.setFont(font)
-                label.setStyleSheet(f"color: {color.name()};")
+        # The canvases paint their text themselves
+        for canvas in self._canvases.values():
+            canvas.set_style(self._font, self._color, self._line_width, self._line_height, _LINE_SPACING)
     
     def update_metrics(self, formatted_metrics):
         """
-        Update the displayed metrics.
+        Update the displayed metrics, at most max_redraw_hz times per second.
         
         Args:
             formatted_metrics: Dictionary of formatted metrics for each component
         """
+        if self._redraw_timer.isActive():
+            # Redrew too recently: keep only the latest metrics for when the interval ends
+            self._pending_metrics = formatted_metrics
+            return
+        self._draw_metrics(formatted_metrics)
+        max_redraw_hz = self.config["appearance"].get("max_redraw_hz", DEFAULT_MAX_REDRAW_HZ)
+        if max_redraw_hz > 0:
+            self._redraw_timer.start(int(1000 / max_redraw_hz))
+    
+    def _flush_pending_metrics(self):
+        """Draw the metrics held back by the redraw rate limit, if any"""
+        if self._pending_metrics is not None:
+            formatted_metrics, self._pending_metrics = self._pending_metrics, None
+            self.update_metrics(formatted_metrics)
+    
+    def _draw_metrics(self, formatted_metrics):
+        """
+        Push formatted metrics into the section canvases.
+        
+        Args:
+            formatted_metrics: Dictionary of formatted metrics for each component
+        """
+        # Nothing to show while hidden (e.g. via the tray); the next update after showing refills it
+        if not self.isVisible():
+            return
+        
+        # Each canvas invalidates itself only if its lines changed; Qt paints them together
         try:
             # Update each component section
             for component_name in ["cpu", "gpu", "ram", "network"]:
@@ -247,36 +272,31 @@ class MetricsDisplay(QWidget):
             component_name: Name of the component (cpu, gpu, ram, network)
             metrics_dict: Dictionary of formatted metrics for this component
         """
-        if not self.config["display"][f"show_{component_name}"]:
+        # Only shown components have a section
+        if component_name not in self._component_containers:
+            return
+        
+        # Nothing to do if the texts are the ones the canvas already shows
+        sig = tuple(metrics_dict.items())
+        if sig == self._last_sig.get(component_name):
             return
+        self._last_sig[component_name] = sig
             
-        # Collect all metrics for this component in the correct order
-        metrics_to_display = []
-        for metric_key, text in metrics_dict.items():
-            display_key = f"show_{metric_key}"
-            if display_key in self.config["display"] and self.config["display"][display_key]:
-                # Get order for this metric
-                order = self.config["layout"]["metric_order"].get(metric_key, 999)
-                # Store tuple of (order, text)
-                metrics_to_display.append((order, text))
-        
-        # Sort metrics by their configured order
-        metrics_to_display.sort(key=lambda x: x[0])
-        
-        # Extract just the formatted text from the sorted list
-        display_texts = [item[1] for item in metrics_to_display]
-        
-        # Update labels in the component
-        labels = self.component_labels[component_name]
-        for i, text in enumerate(display_texts):
-            if i < len(labels):
-                labels[i].setText(text)
-                labels[i].setVisible(True)  # Make label visible
-        
-        # Hide any unused labels
-        for i in range(len(display_texts), len(labels)):
-            labels[i].setText("")
-            labels[i].setVisible(False)  # Hide unused labels
+        # Keys of the shown metrics in their configured order, sorted once per config
+        order = self._order_cache.get(component_name)
+        if order is None:
+            display = self.config["display"]
+            metric_order = self.config["layout"]["metric_order"]
+            order = self._order_cache[component_name] = tuple(sorted(
+                (metric_key for metric_key in metrics_dict if display.get(f"show_{metric_key}", False)),
+                key=lambda metric_key: metric_order.get(metric_key, 999)
+            ))
+        
+        # Texts of this component's shown metrics, in display order
+        display_texts = [metrics_dict[metric_key] for metric_key in order if metric_key in metrics_dict]
+        
+        # The canvas repaints only if a line changed
+        self._canvases[component_name].set_lines(display_texts)
     
     def sizeHint(self):
         """
@@ -4,11 +4,105 @@ Metrics Formatter Module
 This module handles formatting of metrics for display in the UI.
 """
 
+def _spec(*rows):
+    """Expand (source key, metric key, label, value format) rows into (source key, metric key, template, missing text)"""
+    return tuple((source, key, f"{label}: {value_format}".format, f"{label}: N/A") for source, key, label, value_format in rows)
+
+# Templates of the metrics built outside the spec tables, bound once
+_FMT_CPU_FREQ = "Freq: {:.2f} GHz".format
+_FMT_VRAM = "VRAM: {0[0]:.1f}/{0[1]:.1f} GB".format  # Takes a (used, total) pair
+_FMT_RAM_USED = "Used: {0[0]:.1f}/{0[1]:.1f} GB".format  # Takes a (used, total) pair
+
 class MetricsFormatter:
     """Class responsible for formatting hardware metrics for display"""
     
-    @staticmethod
-    def format_cpu_metrics(data):
+    # Metrics formatted straight from one value of the category's data; the ones
+    # needing a conversion or two values are handled in the format_* methods
+    _CPU_SPEC = _spec(
+        ("usage", "cpu_usage", "Usage", "{:.1f}%"),
+        ("temperature", "cpu_temperature", "Temp", "{:.1f}°C"),
+        ("voltage", "cpu_voltage", "Voltage", "{:.3f}V"),
+    )
+    _GPU_SPEC = _spec(
+        ("core_usage", "gpu_core_usage", "Core Usage", "{:.1f}%"),
+        ("core_temperature", "gpu_core_temperature", "Core Temp", "{:.1f}°C"),
+        ("core_frequency", "gpu_core_frequency", "Core Freq", "{:.0f} MHz"),
+        ("memory_frequency", "gpu_memory_frequency", "Mem Freq", "{:.0f} MHz"),
+        ("memory_temperature", "gpu_memory_temperature", "Mem Temp", "{:.1f}°C"),
+        ("hotspot_temperature", "gpu_hotspot_temperature", "Hotspot", "{:.1f}°C"),
+        ("vram_usage_percent", "gpu_vram_usage", "VRAM usage", "{:.1f}%"),
+        ("fan_speed", "gpu_fan_speed", "Fan", "{:.0f}%"),
+    )
+    _RAM_SPEC = _spec(
+        ("percent", "ram_percent", "Usage", "{:.1f}%"),
+        ("available", "ram_available", "Available", "{:.1f} GB"),
+        ("ram_temperature", "ram_temperature", "Temp", "{:.1f}°C"),
+    )
+    _NETWORK_SPEC = _spec(
+        ("upload_speed", "network_upload_speed", "Upload", "{:.2f} MB/s"),
+        ("download_speed", "network_download_speed", "Download", "{:.2f} MB/s"),
+        ("total_sent", "network_total_sent", "Total Sent", "{:.1f} GB"),
+        ("total_received", "network_total_received", "Total Recv", "{:.1f} GB"),
+    )
+    
+    __slots__ = ("_cache",)
+    
+    def __init__(self):
+        """Initialize the formatter with an empty cache of formatted strings"""
+        # Last (value, formatted string) per metric key; most values repeat between ticks
+        self._cache = {}
+    
+    def _format(self, key, value, template, missing):
+        """
+        Format a metric value, reusing the previous string when the value is unchanged.
+        
+        Args:
+            key: Metric key the string is cached under
+            value: Raw value, or None when unavailable
+            template: Bound str.format of the template, called with the value
+            missing: Text to show when the value is None
+            
+        Returns:
+            str: The formatted metric string
+        """
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        text = template(value) if value is not None else missing
+        self._cache[key] = (value, text)
+        return text
+    
+    def _apply(self, data, spec):
+        """
+        Format every metric of a spec table from a category's data.
+        
+        Args:
+            data: Dictionary containing the category's metrics
+            spec: (source key, metric key, bound template, missing text) rows
+            
+        Returns:
+            dict: Dictionary of formatted metric strings, a new one per call: it is
+                  emitted to the GUI thread while the worker formats the next tick
+        """
+        fmt = self._format
+        get = data.get
+        return {key: fmt(key, get(source), template, missing) for source, key, template, missing in spec}
+    
+    def category_formatters(self):
+        """
+        Get the formatter for each metrics category, in display order.
+        
+        Returns:
+            tuple: (category, format method) pairs
+        """
+        return (
+            ("cpu", self.format_cpu_metrics),
+            ("gpu", self.format_gpu_metrics),
+            ("ram", self.format_ram_metrics),
+            ("network", self.format_network_metrics),
+        )
+    
+    def format_cpu_metrics(self, data):
         """
         Format CPU metrics for display.
         
@@ -18,34 +112,18 @@ class MetricsFormatter:
         Returns:
             dict: Dictionary of formatted CPU metric strings
         """
-        formatted = {}
-        
-        # CPU Usage
-        usage = data.get("usage")
-        formatted["cpu_usage"] = f"Usage: {usage:.1f}%" if usage is not None else "Usage: N/A"
-        
-        # CPU Temperature
-        temp = data.get("temperature")
-        formatted["cpu_temperature"] = f"Temp: {temp:.1f}°C" if temp is not None else "Temp: N/A"
+        formatted = self._apply(data, self._CPU_SPEC)
         
         # CPU Frequency
         freq = data.get("frequency")
-        if freq is not None:
-            # Convert MHz to GHz if needed
-            if freq > 1000:  # If value is in MHz
-                freq = freq / 1000
-            formatted["cpu_frequency"] = f"Freq: {freq:.2f} GHz"
-        else:
-            formatted["cpu_frequency"] = "Freq: N/A"
-        
-        # CPU Voltage
-        voltage = data.get("voltage")
-        formatted["cpu_voltage"] = f"Voltage: {voltage:.3f}V" if voltage is not None else "Voltage: N/A"
+        # Convert MHz to GHz if needed
+        if freq is not None and freq > 1000:  # If value is in MHz
+            freq = freq / 1000
+        formatted["cpu_frequency"] = self._format("cpu_frequency", freq, _FMT_CPU_FREQ, "Freq: N/A")
         
         return formatted
     
-    @staticmethod
-    def format_gpu_metrics(data):
+    def format_gpu_metrics(self, data):
         """
         Format GPU metrics for display.
         
@@ -55,52 +133,17 @@ class MetricsFormatter:
         Returns:
             dict: Dictionary of formatted GPU metric strings
         """
-        formatted = {}
-        
-        # GPU Core Usage
-        usage = data.get("core_usage")
-        formatted["gpu_core_usage"] = f"Core Usage: {usage:.1f}%" if usage is not None else "Core Usage: N/A"
-        
-        # GPU Core Temperature
-        temp = data.get("core_temperature")
-        formatted["gpu_core_temperature"] = f"Core Temp: {temp:.1f}°C" if temp is not None else "Core Temp: N/A"
-        
-        # GPU Core Frequency
-        freq = data.get("core_frequency")
-        formatted["gpu_core_frequency"] = f"Core Freq: {freq:.0f} MHz" if freq is not None else "Core Freq: N/A"
-        
-        # GPU Memory Frequency
-        freq = data.get("memory_frequency")
-        formatted["gpu_memory_frequency"] = f"Mem Freq: {freq:.0f} MHz" if freq is not None else "Mem Freq: N/A"
-        
-        # GPU Memory Temperature
-        temp = data.get("memory_temperature")
-        formatted["gpu_memory_temperature"] = f"Mem Temp: {temp:.1f}°C" if temp is not None else "Mem Temp: N/A"
-        
-        # GPU Hotspot Temperature
-        temp = data.get("hotspot_temperature")
-        formatted["gpu_hotspot_temperature"] = f"Hotspot: {temp:.1f}°C" if temp is not None else "Hotspot: N/A"
-        
-        # GPU VRAM Usage
-        usage = data.get("vram_usage_percent")
-        formatted["gpu_vram_usage"] = f"VRAM usage: {usage:.1f}%" if usage is not None else "VRAM usage: N/A"
+        formatted = self._apply(data, self._GPU_SPEC)
         
         # GPU VRAM Memory
         used = data.get("vram_used_gb")
         total = data.get("vram_total_gb")
-        if used is not None and total is not None and total > 0:
-            formatted["gpu_vram_memory"] = f"VRAM: {used:.1f}/{total:.1f} GB"
-        else:
-            formatted["gpu_vram_memory"] = "VRAM: N/A"
-        
-        # GPU Fan Speed
-        speed = data.get("fan_speed")
-        formatted["gpu_fan_speed"] = f"Fan: {speed:.0f}%" if speed is not None else "Fan: N/A"
+        vram = (used, total) if used is not None and total is not None and total > 0 else None
+        formatted["gpu_vram_memory"] = self._format("gpu_vram_memory", vram, _FMT_VRAM, "VRAM: N/A")
         
         return formatted
     
-    @staticmethod
-    def format_ram_metrics(data):
+    def format_ram_metrics(self, data):
         """
         Format RAM metrics for display.
         
@@ -110,32 +153,17 @@ class MetricsFormatter:
         Returns:
             dict: Dictionary of formatted RAM metric strings
         """
-        formatted = {}
-        
-        # RAM Usage Percent
-        percent = data.get("percent")
-        formatted["ram_percent"] = f"Usage: {percent:.1f}%" if percent is not None else "Usage: N/A"
+        formatted = self._apply(data, self._RAM_SPEC)
         
         # RAM Used/Total
         used = data.get("used")
         total = data.get("total")
-        if used is not None and total is not None:
-            formatted["ram_used_total"] = f"Used: {used:.1f}/{total:.1f} GB"
-        else:
-            formatted["ram_used_total"] = "Used: N/A"
-        
-        # RAM Available
-        available = data.get("available")
-        formatted["ram_available"] = f"Available: {available:.1f} GB" if available is not None else "Available: N/A"
-        
-        # RAM Temperature
-        temp = data.get("ram_temperature")
-        formatted["ram_temperature"] = f"Temp: {temp:.1f}°C" if temp is not None else "Temp: N/A"
+        used_total = (used, total) if used is not None and total is not None else None
+        formatted["ram_used_total"] = self._format("ram_used_total", used_total, _FMT_RAM_USED, "Used: N/A")
         
         return formatted
     
-    @staticmethod
-    def format_network_metrics(data):
+    def format_network_metrics(self, data):
         """
         Format network metrics for display.
         
@@ -145,22 +173,4 @@ class MetricsFormatter:
         Returns:
             dict: Dictionary of formatted network metric strings
         """
-        formatted = {}
-        
-        # Network Upload Speed
-        upload = data.get("upload_speed")
-        formatted["network_upload_speed"] = f"Upload: {upload:.2f} MB/s" if upload is not None else "Upload: N/A"
-        
-        # Network Download Speed
-        download = data.get("download_speed")
-        formatted["network_download_speed"] = f"Download: {download:.2f} MB/s" if download is not None else "Download: N/A"
-        
-        # Network Total Sent
-        sent = data.get("total_sent")
-        formatted["network_total_sent"] = f"Total Sent: {sent:.1f} GB" if sent is not None else "Total Sent: N/A"
-        
-        # Network Total Received
-        received = data.get("total_received")
-        formatted["network_total_received"] = f"Total Recv: {received:.1f} GB" if received is not None else "Total Recv: N/A"
-        
-        return formatted
+        return self._apply(data, self._NETWORK_SPEC)
@@ -18,6 +18,56 @@ class PositionManager:
             config: Application configuration dictionary
         """
         self.config = config
+        
+        # Geometry of the selected monitor and the monitor_index it was resolved for,
+        # kept until a screen is added, removed or changes geometry
+        self._cached_index = None
+        self._cached_geo = None
+        app = QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._invalidate_screen)
+        app.primaryScreenChanged.connect(self._invalidate_screen)
+        for screen in app.screens():
+            screen.geometryChanged.connect(self._invalidate_screen)
+    
+    def _on_screen_added(self, screen):
+        """Watch a new screen's geometry and drop the cached one"""
+        screen.geometryChanged.connect(self._invalidate_screen)
+        self._invalidate_screen()
+    
+    def _invalidate_screen(self, *args):
+        """Forget the cached monitor geometry"""
+        self._cached_index = None
+        self._cached_geo = None
+    
+    def _screen_geometry(self):
+        """
+        Get the geometry of the configured monitor, querying the screens only when they changed.
+        
+        Returns:
+            QRect: The geometry of the selected monitor (primary if the index is invalid)
+        """
+        monitor_index = self.config["appearance"].get("monitor_index", 0)
+        if monitor_index == self._cached_index:
+            return self._cached_geo
+        
+        screens = QApplication.screens()
+        
+        # Validate monitor index, falling back to the primary monitor
+        index = monitor_index if 0 <= monitor_index < len(screens) else 0
+        
+        self._cached_geo = screens[index].geometry()
+        self._cached_index = monitor_index
+        return self._cached_geo
+    
+    def update_config(self, config):
+        """
+        Use a new configuration for later position calculations.
+        
+        Args:
+            config: Application configuration dictionary
+        """
+        self.config = config
     
     def calculate_position(self, widget_size):
         """
@@ -31,18 +81,8 @@ class PositionManager:
         """
         position = self.config["appearance"]["position"]
         
-        # Get selected monitor
-        monitor_index = self.config["appearance"].get("monitor_index", 0)
-        screens = QApplication.screens()
-        
-        # Validate monitor index
-        if monitor_index < 0 or monitor_index >= len(screens):
-            # Fallback to primary monitor
-            monitor_index = 0
-        
         # Get the geometry of the selected monitor
-        screen = screens[monitor_index]
-        screen_geo = screen.geometry()
+        screen_geo = self._screen_geometry()
         
         # Get offset values
         offset_x = self.config["appearance"].get("offset_x", 0)
@@ -107,12 +147,4 @@ class PositionManager:
         Returns:
             QRect: The geometry of the selected monitor
         """
-        monitor_index = self.config["appearance"].get("monitor_index", 0)
-        screens = QApplication.screens()
-        
-        # Validate monitor index
-        if monitor_index < 0 or monitor_index >= len(screens):
-            monitor_index = 0
-        
-        screen = screens[monitor_index]
-        return screen.geometry()
+        return self._screen_geometry()
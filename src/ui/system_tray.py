@@ -20,6 +20,10 @@ class SystemTrayManager:
         """
         self.parent = parent
         self.tray_icon = QSystemTrayIcon(parent)
+        
+        # Visibility each action's text was last set for, so repeated updates skip setText
+        self._toggle_state = None
+        self._console_state = None
         self.setup_tray()
     
     def setup_tray(self):
@@ -47,9 +51,18 @@ class SystemTrayManager:
         self.exit_action = QAction("Exit")
         self.tray_menu.addAction(self.exit_action)
         
+        # Icons for each CPU load level, rendered once instead of on every update
+        self._icons = {
+            "default": qta.icon("fa5s.desktop", color="blue"),
+            "low": qta.icon("fa5s.thermometer-empty", color="green"),
+            "med": qta.icon("fa5s.thermometer-half", color="orange"),
+            "high": qta.icon("fa5s.thermometer-full", color="red"),
+        }
+        
         # Set the tray icon and its menu
-        self.tray_icon.setIcon(qta.icon("fa5s.desktop", color="blue"))
-        self.tray_icon.setToolTip("Hardware Monitor")
+        self._icon_bucket = None
+        self._tooltip = None
+        self._set_icon("default", "Hardware Monitor")
         self.tray_icon.setContextMenu(self.tray_menu)
     
     def connect_signals(self, toggle_callback, settings_callback, console_callback, exit_callback):
@@ -95,24 +108,37 @@ class SystemTrayManager:
                 
                 # Choose icon based on CPU load
                 if cpu_usage < 30:
-                    icon = qta.icon("fa5s.thermometer-empty", color="green")
+                    bucket = "low"
                 elif cpu_usage < 70:
-                    icon = qta.icon("fa5s.thermometer-half", color="orange")
+                    bucket = "med"
                 else:
-                    icon = qta.icon("fa5s.thermometer-full", color="red")
+                    bucket = "high"
                     
-                self.tray_icon.setIcon(icon)
-                self.tray_icon.setToolTip(f"Hardware Monitor - CPU: {cpu_usage:.1f}%")
+                # Whole percent: the tooltip then changes, and is resent to the shell, far less often
+                self._set_icon(bucket, f"Hardware Monitor - CPU: {int(cpu_usage)}%")
                 
             except Exception as e:
                 print(f"Error updating tray icon: {e}")
                 # Fallback icon
-                self.tray_icon.setIcon(qta.icon("fa5s.desktop", color="blue"))
-                self.tray_icon.setToolTip("Hardware Monitor")
+                self._set_icon("default", "Hardware Monitor")
         else:
             # No metrics yet, use default icon
-            self.tray_icon.setIcon(qta.icon("fa5s.desktop", color="blue"))
-            self.tray_icon.setToolTip("Hardware Monitor - Collecting Data...")
+            self._set_icon("default", "Hardware Monitor - Collecting Data...")
+    
+    def _set_icon(self, bucket, tooltip):
+        """
+        Show the icon of a load level and a tooltip, skipping whichever is unchanged.
+        
+        Args:
+            bucket: Key into the preloaded icons
+            tooltip: Tooltip text
+        """
+        if bucket != self._icon_bucket:
+            self.tray_icon.setIcon(self._icons[bucket])
+            self._icon_bucket = bucket
+        if tooltip != self._tooltip:
+            self.tray_icon.setToolTip(tooltip)
+            self._tooltip = tooltip
     
     def update_toggle_text(self, is_visible):
         """
@@ -121,6 +147,9 @@ class SystemTrayManager:
         Args:
             is_visible: Whether the widget is currently visible
         """
+        if is_visible == self._toggle_state:
+            return
+        self._toggle_state = is_visible
         self.toggle_action.setText("Hide Widget" if is_visible else "Show Widget")
     
     def update_console_text(self, is_visible):
@@ -130,4 +159,7 @@ class SystemTrayManager:
         Args:
             is_visible: Whether the console is currently visible
         """
+        if is_visible == self._console_state:
+            return
+        self._console_state = is_visible
         self.console_action.setText("Hide Console" if is_visible else "Show Console")
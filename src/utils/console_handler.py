@@ -8,91 +8,148 @@ import os
 import platform
 import ctypes
 
-class ConsoleHandler:
-    """Class for handling console window visibility"""
-    
-    # Windows-specific constants
-    SW_HIDE = 0
-    SW_SHOW = 5
+# The platform can't change while running: query it once
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Win32 functions, resolved and given prototypes once instead of on every call.
+# If that fails the console can't be controlled, and the handler acts as off Windows
+if _IS_WINDOWS:
+    try:
+        # Own library objects: no windll lookups, and the prototypes set below
+        # don't change the functions other modules get from ctypes.windll
+        _kernel32 = ctypes.WinDLL("kernel32", use_last_error=False)
+        _user32 = ctypes.WinDLL("user32", use_last_error=False)
+        _GetConsoleWindow = _kernel32.GetConsoleWindow
+        _GetConsoleWindow.restype = ctypes.c_void_p
+        _GetConsoleWindow.argtypes = []
+        _ShowWindow = _user32.ShowWindow
+        _ShowWindow.restype = ctypes.c_int
+        _ShowWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        _IsWindowVisible = _user32.IsWindowVisible
+        _IsWindowVisible.restype = ctypes.c_int
+        _IsWindowVisible.argtypes = [ctypes.c_void_p]
+    except Exception as e:
+        print(f"Error loading console functions: {e}")
+        _IS_WINDOWS = False
+
+# Windows-specific constants
+SW_HIDE = 0
+SW_SHOW = 5
+
+# Store console visibility state
+_console_visible = True
+
+# Console window handle, fixed for the life of the process once found
+_hwnd = None
+
+# Start from the console's actual state: there may be none, or it may not be shown
+if _IS_WINDOWS:
+    _hwnd = _GetConsoleWindow()
+    _console_visible = bool(_hwnd and _IsWindowVisible(_hwnd))
+
+def _get_hwnd():
+    """
+    Get the console window handle, looking it up only until it is found.
     
-    # Store console visibility state
-    _console_visible = True
+    Returns:
+        int: The console window handle, or None if there is no console
+    """
+    global _hwnd
+    if _hwnd is None:
+        _hwnd = _GetConsoleWindow()
+    return _hwnd
+
+def _set_visibility(visible):
+    """
+    Show or hide the console window (Windows only).
     
-    @classmethod
-    def is_windows(cls):
-        """
-        Check if the current platform is Windows.
+    Args:
+        visible: Whether the console should be shown
         
-        Returns:
-            bool: True if running on Windows, False otherwise
-        """
-        return platform.system() == "Windows"
+    Returns:
+        bool: True if the console was shown or hidden, False if there is no console
+    """
+    global _console_visible
+    hwnd = _get_hwnd()
+    if not hwnd:
+        return False
+    _ShowWindow(hwnd, SW_SHOW if visible else SW_HIDE)
+    _console_visible = visible
+    return True
+
+def is_windows():
+    """
+    Check if the current platform is Windows.
     
-    @classmethod
-    def hide_console(cls):
+    Returns:
+        bool: True if running on Windows, False otherwise
+    """
+    return _IS_WINDOWS
+
+if _IS_WINDOWS:
+    def hide_console():
         """
         Hide the console window on Windows.
         
         Returns:
-            bool: True if the console was hidden, False otherwise
+            bool: True if the console is now hidden, False otherwise
         """
-        if not cls.is_windows():
-            return False
-            
-        try:
-            hwnd = ctypes.windll.kernel32.GetConsoleWindow()
-            if hwnd:
-                ctypes.windll.user32.ShowWindow(hwnd, cls.SW_HIDE)
-                cls._console_visible = False
-                return True
-        except Exception as e:
-            print(f"Error hiding console: {e}")
-        
-        return False
+        if not _console_visible:
+            return True  # Already hidden
+        return _set_visibility(False)
     
-    @classmethod
-    def show_console(cls):
+    def show_console():
         """
         Show the console window on Windows.
         
         Returns:
-            bool: True if the console was shown, False otherwise
+            bool: True if the console is now shown, False otherwise
         """
-        if not cls.is_windows():
-            return False
-            
-        try:
-            hwnd = ctypes.windll.kernel32.GetConsoleWindow()
-            if hwnd:
-                ctypes.windll.user32.ShowWindow(hwnd, cls.SW_SHOW)
-                cls._console_visible = True
-                return True
-        except Exception as e:
-            print(f"Error showing console: {e}")
-        
-        return False
+        if _console_visible:
+            return True  # Already shown
+        return _set_visibility(True)
     
-    @classmethod
-    def toggle_console(cls):
+    def toggle_console():
         """
         Toggle console window visibility on Windows.
         
         Returns:
             bool: The new console visibility state
         """
-        if cls._console_visible:
-            cls.hide_console()
-        else:
-            cls.show_console()
-        
-        return cls._console_visible
+        # One read of the state; _set_visibility stores the new one
+        visible = not _console_visible
+        return visible if _set_visibility(visible) else not visible
+else:
+    # No console to control: the operations do nothing and report that
+    def hide_console():
+        """Hide the console window (not supported on this platform)"""
+        return False
     
-    @classmethod
-    def is_console_visible(cls):
-        """
-        Get the current console visibility state.
-        
-        Returns:
-            bool: True if the console is visible, False otherwise
-        """
-        return cls._console_visible
+    def show_console():
+        """Show the console window (not supported on this platform)"""
+        return False
+    
+    def toggle_console():
+        """Toggle the console window (not supported on this platform); returns the unchanged state"""
+        return _console_visible
+
+def is_console_visible():
+    """
+    Get the current console visibility state.
+    
+    Returns:
+        bool: True if the console is visible, False otherwise
+    """
+    return _console_visible
+
+class ConsoleHandler:
+    """Class for handling console window visibility; forwards to the module functions"""
+    
+    SW_HIDE = SW_HIDE
+    SW_SHOW = SW_SHOW
+    
+    is_windows = staticmethod(is_windows)
+    hide_console = staticmethod(hide_console)
+    show_console = staticmethod(show_console)
+    toggle_console = staticmethod(toggle_console)
+    is_console_visible = staticmethod(is_console_visible)